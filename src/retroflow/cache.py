@@ -0,0 +1,77 @@
+"""
+Bounded caches shared by the pipeline components.
+
+Classes:
+    LRUCache: Mapping with a size limit that evicts the least recently used
+        entry.
+"""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterator, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping that holds at most maxsize entries.
+
+    Reading an entry marks it as recently used; storing a new entry past
+    the limit evicts the entry that was used least recently.
+
+    Attributes:
+        maxsize: Maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+        """
+        self.maxsize = maxsize
+        # Entries in order of use, least recently used first
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the value stored for key, or None if it is not cached.
+
+        Args:
+            key: Key to look up.
+
+        Returns:
+            The cached value, or None.
+        """
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Key to store the value under.
+            value: Value to cache.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
@@ -24,7 +24,7 @@ Usage:
     >>> print(diff)
 """
 
-from typing import List, Protocol
+from typing import Dict, List, Optional, Protocol
 
 from .tracer import RenderTrace
 
@@ -43,6 +43,38 @@ class CanvasProtocol(Protocol):
         """Get character at position."""
         ...
 
+    def get_hspan(self, x_start: int, x_end: int, y: int) -> List[str]:
+        """Get the characters in a row span."""
+        ...
+
+    def hline(self, x_start: int, x_end: int, y: int, char: str) -> None:
+        """Fill a row span with a character."""
+        ...
+
+    def get_vspan(self, x: int, y_start: int, y_end: int) -> List[str]:
+        """Get the characters in a column span."""
+        ...
+
+    def vline(self, x: int, y_start: int, y_end: int, char: str) -> None:
+        """Fill a column span with a character."""
+        ...
+
+    def merge_cell(self, x: int, y: int, merge: Dict[str, str]) -> None:
+        """Merge a character into a single cell."""
+        ...
+
+    def merge_hline(
+        self, x_start: int, x_end: int, y: int, merge: Dict[str, str]
+    ) -> None:
+        """Merge a line into a row span."""
+        ...
+
+    def merge_vline(
+        self, x: int, y_start: int, y_end: int, merge: Dict[str, str]
+    ) -> None:
+        """Merge a line into a column span."""
+        ...
+
     def draw_text(self, x: int, y: int, text: str) -> None:
         """Draw text starting at position."""
         ...
@@ -154,6 +186,85 @@ class TracedCanvas:
         """Get character at position (x, y)."""
         return self._canvas.get(x, y)
 
+    def get_hspan(self, x_start: int, x_end: int, y: int) -> List[str]:
+        """Get the characters in columns x_start..x_end-1 of row y."""
+        return self._canvas.get_hspan(x_start, x_end, y)
+
+    def hline(
+        self, x_start: int, x_end: int, y: int, char: str, reason: str = ""
+    ) -> None:
+        """
+        Fill columns x_start..x_end-1 of row y with a character.
+
+        Each cell is recorded as a separate placement.
+        """
+        for x in range(x_start, x_end):
+            self.set(x, y, char, reason)
+
+    def get_vspan(self, x: int, y_start: int, y_end: int) -> List[str]:
+        """Get the characters in rows y_start..y_end-1 of column x."""
+        return self._canvas.get_vspan(x, y_start, y_end)
+
+    def vline(
+        self, x: int, y_start: int, y_end: int, char: str, reason: str = ""
+    ) -> None:
+        """
+        Fill rows y_start..y_end-1 of column x with a character.
+
+        Each cell is recorded as a separate placement.
+        """
+        for y in range(y_start, y_end):
+            self.set(x, y, char, reason)
+
+    def merge_hline(
+        self,
+        x_start: int,
+        x_end: int,
+        y: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Merge a line into columns x_start..x_end-1 of row y.
+
+        Each changed cell is recorded as a separate placement.
+        """
+        for x in range(x_start, x_end):
+            self.merge_cell(x, y, merge, reasons)
+
+    def merge_vline(
+        self,
+        x: int,
+        y_start: int,
+        y_end: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Merge a line into rows y_start..y_end-1 of column x.
+
+        Each changed cell is recorded as a separate placement.
+        """
+        for y in range(y_start, y_end):
+            self.merge_cell(x, y, merge, reasons)
+
+    def merge_cell(
+        self,
+        x: int,
+        y: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Replace the character at (x, y) if merge maps it.
+
+        A changed cell is recorded as a placement.
+        """
+        current = self._canvas.get(x, y)
+        char = merge.get(current)
+        if char is not None:
+            self.set(x, y, char, reasons.get(current, "") if reasons else "")
+
     def draw_text(self, x: int, y: int, text: str) -> None:
         """
         Draw text starting at position (x, y).
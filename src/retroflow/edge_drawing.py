@@ -12,13 +12,108 @@ The EdgeDrawer class centralizes edge rendering logic and is used by the
 FlowchartGenerator to draw connections between nodes.
 """
 
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 
 from .layout import LayoutResult
 from .models import ColumnBoundary, LayerBoundary
-from .positioning import PositionCalculator
+from .positioning import BACK_EDGE_LANE_WIDTH, PositionCalculator
 from .renderer import ARROW_CHARS, BOX_CHARS, LINE_CHARS, BoxDimensions, Canvas
 
+# Cells an edge may draw over freely: blank canvas and box shadows
+_EMPTY_CELLS = frozenset((" ", BOX_CHARS["shadow"]))
+
+# How a line merges with the character already in a cell:
+# current character -> new character. Unlisted cells are kept.
+_VERTICAL_MERGE = {
+    LINE_CHARS["horizontal"]: LINE_CHARS["cross"],
+    # Corners with a "right" segment + vertical = tee_right (├)
+    LINE_CHARS["corner_top_left"]: LINE_CHARS["tee_right"],
+    LINE_CHARS["corner_bottom_left"]: LINE_CHARS["tee_right"],
+    # Corners with a "left" segment + vertical = tee_left (┤)
+    LINE_CHARS["corner_top_right"]: LINE_CHARS["tee_left"],
+    LINE_CHARS["corner_bottom_right"]: LINE_CHARS["tee_left"],
+    # Tees with horizontal segments + vertical = cross
+    LINE_CHARS["tee_up"]: LINE_CHARS["cross"],
+    LINE_CHARS["tee_down"]: LINE_CHARS["cross"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["vertical"]),
+}
+_HORIZONTAL_MERGE = {
+    LINE_CHARS["vertical"]: LINE_CHARS["cross"],
+    # Corners with a "down" segment + horizontal = tee_down (┬)
+    LINE_CHARS["corner_top_left"]: LINE_CHARS["tee_down"],
+    LINE_CHARS["corner_top_right"]: LINE_CHARS["tee_down"],
+    # Corners with an "up" segment + horizontal = tee_up (┴)
+    LINE_CHARS["corner_bottom_left"]: LINE_CHARS["tee_up"],
+    LINE_CHARS["corner_bottom_right"]: LINE_CHARS["tee_up"],
+    # Tees with vertical segments + horizontal = cross
+    LINE_CHARS["tee_right"]: LINE_CHARS["cross"],
+    LINE_CHARS["tee_left"]: LINE_CHARS["cross"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["horizontal"]),
+}
+
+# Trace reasons for the merges above, keyed by the replaced character
+_VERTICAL_MERGE_REASONS = {
+    LINE_CHARS["horizontal"]: "vertical_crosses_horizontal",
+    **dict.fromkeys(
+        (
+            LINE_CHARS["corner_top_left"],
+            LINE_CHARS["corner_bottom_left"],
+            LINE_CHARS["corner_top_right"],
+            LINE_CHARS["corner_bottom_right"],
+        ),
+        "upgrade_corner_to_tee",
+    ),
+    LINE_CHARS["tee_up"]: "upgrade_tee_to_cross",
+    LINE_CHARS["tee_down"]: "upgrade_tee_to_cross",
+    **dict.fromkeys(_EMPTY_CELLS, "vertical_line"),
+}
+_HORIZONTAL_MERGE_REASONS = {
+    LINE_CHARS["vertical"]: "horizontal_crosses_vertical",
+    **dict.fromkeys(
+        (
+            LINE_CHARS["corner_top_left"],
+            LINE_CHARS["corner_top_right"],
+            LINE_CHARS["corner_bottom_left"],
+            LINE_CHARS["corner_bottom_right"],
+        ),
+        "upgrade_corner_to_tee",
+    ),
+    LINE_CHARS["tee_right"]: "upgrade_vertical_tee_to_cross",
+    LINE_CHARS["tee_left"]: "upgrade_vertical_tee_to_cross",
+    **dict.fromkeys(_EMPTY_CELLS, "horizontal_line"),
+}
+
+# Simpler merges used by back edges, which only cross straight lines. They
+# have no reasons, so TracedCanvas infers them from the new character.
+_VERTICAL_OVERLAY = {
+    LINE_CHARS["horizontal"]: LINE_CHARS["cross"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["vertical"]),
+}
+_HORIZONTAL_OVERLAY = {
+    LINE_CHARS["vertical"]: LINE_CHARS["cross"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["horizontal"]),
+}
+# Also turns a corner opening down and right (┌) into a tee (┬)
+_HORIZONTAL_OVERLAY_TEE = {
+    **_HORIZONTAL_OVERLAY,
+    LINE_CHARS["corner_top_left"]: LINE_CHARS["tee_down"],
+}
+_HORIZONTAL_FILL = dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["horizontal"])
+
+# Single-cell merges for the corner where a back edge leaves the margin:
+# TB turns right off the left margin, LR turns down off the top margin
+_MARGIN_TURN_RIGHT = {
+    LINE_CHARS["vertical"]: LINE_CHARS["tee_right"],
+    LINE_CHARS["horizontal"]: LINE_CHARS["tee_down"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["corner_top_left"]),
+}
+_MARGIN_TURN_DOWN = {
+    LINE_CHARS["horizontal"]: LINE_CHARS["tee_down"],
+    LINE_CHARS["vertical"]: LINE_CHARS["tee_down"],
+    **dict.fromkeys(_EMPTY_CELLS, LINE_CHARS["corner_top_left"]),
+}
+
 
 class EdgeDrawer:
     """
@@ -49,6 +144,7 @@ class EdgeDrawer:
         self.shadow = shadow
         # Track box regions to avoid drawing lines through them
         self._box_regions: List[Tuple[int, int, int, int]] = []  # (x, y, width, height)
+        self._box_full_regions: List[Tuple[int, int, int, int]] = []
 
     def _set_box_regions(
         self,
@@ -63,7 +159,7 @@ class EdgeDrawer:
             box_dimensions: Dictionary of box dimensions.
         """
         self._box_regions = []
-        self._box_full_regions: List[Tuple[int, int, int, int]] = []
+        self._box_full_regions = []
         for name, (x, y) in box_positions.items():
             dims = box_dimensions[name]
             # Include the box content area (inside borders)
@@ -117,6 +213,40 @@ class EdgeDrawer:
                 return True
         return False
 
+    def _row_span_is_clear(self, x_start: int, x_end: int, y: int) -> bool:
+        """
+        Check that no box (including its borders) touches a row span.
+
+        Args:
+            x_start: First X coordinate of the span (inclusive).
+            x_end: Last X coordinate of the span (exclusive).
+            y: Y coordinate of the row.
+
+        Returns:
+            True if columns x_start..x_end-1 of row y are clear of all boxes.
+        """
+        for bx, by, bw, bh in self._box_full_regions:
+            if by <= y < by + bh and bx < x_end and bx + bw > x_start:
+                return False
+        return True
+
+    def _column_span_is_clear(self, x: int, y_start: int, y_end: int) -> bool:
+        """
+        Check that no box (including its borders) touches a column span.
+
+        Args:
+            x: X coordinate of the column.
+            y_start: First Y coordinate of the span (inclusive).
+            y_end: Last Y coordinate of the span (exclusive).
+
+        Returns:
+            True if rows y_start..y_end-1 of column x are clear of all boxes.
+        """
+        for bx, by, bw, bh in self._box_full_regions:
+            if bx <= x < bx + bw and by < y_end and by + bh > y_start:
+                return False
+        return True
+
     def _find_boxes_in_region(
         self,
         box_positions: Dict[str, Tuple[int, int]],
@@ -180,16 +310,22 @@ class EdgeDrawer:
         # Set box regions to avoid when drawing lines
         self._set_box_regions(box_positions, box_dimensions)
 
-        # Build lookup for node layers
-        node_layer = {name: node.layer for name, node in layout_result.nodes.items()}
+        node_layer = layout_result.node_layers
+
+        # Middle of each layer's gap zone, shared by every edge routed through it
+        gap_middles = [(b.gap_start_y + b.gap_end_y) // 2 for b in layer_boundaries]
 
-        # Group edges by source to allocate ports properly
-        edges_from: Dict[str, List[str]] = {}
-        edges_to: Dict[str, List[str]] = {}
+        # Group edges by source to allocate ports properly, staging the
+        # forward edges with their layers resolved so they are only
+        # filtered once
+        edges_from: Dict[str, List[str]] = defaultdict(list)
+        edges_to: Dict[str, List[str]] = defaultdict(list)
+        forward_edges: List[Tuple[str, str, int, int]] = []
 
+        back_edges = layout_result.back_edges
         for source, target in layout_result.edges:
             # Skip back edges (edges going to earlier or same layer)
-            if (source, target) in layout_result.back_edges:
+            if (source, target) in back_edges:
                 continue
 
             src_layer = node_layer.get(source, 0)
@@ -199,12 +335,8 @@ class EdgeDrawer:
             if tgt_layer <= src_layer:
                 continue
 
-            if source not in edges_from:
-                edges_from[source] = []
+            forward_edges.append((source, target, src_layer, tgt_layer))
             edges_from[source].append(target)
-
-            if target not in edges_to:
-                edges_to[target] = []
             edges_to[target].append(source)
 
         # Sort edges for consistent port allocation
@@ -212,32 +344,107 @@ class EdgeDrawer:
             edges_from[source].sort(key=lambda t: layout_result.nodes[t].position)
         for target in edges_to:
             edges_to[target].sort(key=lambda s: layout_result.nodes[s].position)
+        port_indices = self._port_indices(edges_from, edges_to)
+        fanout_targets = self._fanout_targets(
+            edges_from, box_positions, box_dimensions, horizontal=False
+        )
 
         # Draw each forward edge
-        for source, target in layout_result.edges:
-            if (source, target) in layout_result.back_edges:
-                continue
-
-            src_layer = node_layer.get(source, 0)
-            tgt_layer = node_layer.get(target, 0)
-
-            if tgt_layer <= src_layer:
-                continue
-
+        for source, target, src_layer, tgt_layer in forward_edges:
             self._draw_edge(
                 canvas,
                 source,
                 target,
                 box_dimensions,
                 box_positions,
-                edges_from.get(source, []),
-                edges_to.get(target, []),
-                layer_boundaries,
+                edges_from[source],
+                edges_to[target],
+                port_indices[source, target],
+                fanout_targets[source],
+                gap_middles,
                 src_layer,
                 tgt_layer,
                 layout_result,
             )
 
+    @staticmethod
+    def _fanout_targets(
+        edges_from: Dict[str, List[str]],
+        box_positions: Dict[str, Tuple[int, int]],
+        box_dimensions: Dict[str, BoxDimensions],
+        horizontal: bool,
+    ) -> Dict[str, Set[str]]:
+        """
+        Find the targets of each source that need fan-out routing.
+
+        A target needs fan-out routing when the content area inside its
+        borders does not overlap the source's across the flow direction
+        (columns in TB mode, rows in LR mode), so no straight line joins them.
+        If any other target of a source needs it, every edge of that source
+        is fanned out to avoid crossings.
+
+        Args:
+            edges_from: Targets of each source node.
+            box_positions: Dictionary of box positions.
+            box_dimensions: Dictionary of box dimensions.
+            horizontal: True for LR mode, False for TB mode.
+
+        Returns:
+            Dictionary mapping each source to its targets without overlap.
+        """
+
+        def content_span(node: str) -> Tuple[int, int]:
+            x, y = box_positions[node]
+            dims = box_dimensions[node]
+            if horizontal:
+                # Compact boxes have a single content row
+                return y + 1, max(y + 1, y + dims.height - 2)
+            return x + 1, x + dims.width - 2
+
+        fanout: Dict[str, Set[str]] = {}
+        for source, targets in edges_from.items():
+            src_start, src_end = content_span(source)
+            fanout[source] = set()
+            if len(targets) < 2:
+                continue
+            for target in targets:
+                tgt_start, tgt_end = content_span(target)
+                overlap_start = max(src_start, tgt_start)
+                overlap_end = min(src_end, tgt_end)
+                # A single shared row counts as overlap in LR mode
+                if overlap_start > overlap_end or (
+                    not horizontal and overlap_start == overlap_end
+                ):
+                    fanout[source].add(target)
+        return fanout
+
+    @staticmethod
+    def _port_indices(
+        edges_from: Dict[str, List[str]], edges_to: Dict[str, List[str]]
+    ) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """
+        Map each edge to the port slots it uses on its source and target.
+
+        Args:
+            edges_from: Sorted targets of each source node.
+            edges_to: Sorted sources of each target node.
+
+        Returns:
+            Dictionary mapping (source, target) to (index of target among the
+            source's targets, index of source among the target's sources).
+        """
+        src_idx: Dict[Tuple[str, str], int] = {}
+        for source, targets in edges_from.items():
+            for idx, target in enumerate(targets):
+                src_idx.setdefault((source, target), idx)
+
+        tgt_idx: Dict[Tuple[str, str], int] = {}
+        for target, sources in edges_to.items():
+            for idx, source in enumerate(sources):
+                tgt_idx.setdefault((source, target), idx)
+
+        return {edge: (idx, tgt_idx[edge]) for edge, idx in src_idx.items()}
+
     def _draw_edge(
         self,
         canvas: Canvas,
@@ -247,7 +454,9 @@ class EdgeDrawer:
         box_positions: Dict[str, Tuple[int, int]],
         source_targets: List[str],
         target_sources: List[str],
-        layer_boundaries: List[LayerBoundary],
+        port_idx: Tuple[int, int],
+        fanout_targets: Set[str],
+        gap_middles: List[int],
         src_layer: int,
         tgt_layer: int,
         layout_result: LayoutResult,
@@ -281,6 +490,7 @@ class EdgeDrawer:
                 box_positions,
                 source_targets,
                 target_sources,
+                port_idx,
                 layout_result,
             )
             return
@@ -299,6 +509,7 @@ class EdgeDrawer:
                 box_positions,
                 source_targets,
                 target_sources,
+                port_idx,
                 layout_result,
             )
             return
@@ -338,39 +549,15 @@ class EdgeDrawer:
 
         # Check if other targets from this source require fan-out routing
         # If so, we should use fan-out routing for ALL edges to avoid crossing
-        other_targets_need_fanout = False
-        if len(source_targets) > 1:
-            for t in source_targets:
-                if t == target:
-                    continue
-                t_dims = box_dimensions[t]
-                t_x, _ = box_positions[t]
-                t_left = t_x + 1
-                t_right = t_x + t_dims.width - 2
-                t_overlap_left = max(src_left, t_left)
-                t_overlap_right = min(src_right, t_right)
-                if t_overlap_left >= t_overlap_right:
-                    # This target has no overlap, will use fan-out routing
-                    other_targets_need_fanout = True
-                    break
+        other_targets_need_fanout = any(t != target for t in fanout_targets)
 
         if has_overlap and not boxes_in_path and not other_targets_need_fanout:
-            # Boxes overlap and no obstructions - find overlapping targets
-            overlapping_targets = []
-            for t in source_targets:
-                t_dims = box_dimensions[t]
-                t_x, _ = box_positions[t]
-                t_left = t_x + 1
-                t_right = t_x + t_dims.width - 2
-                t_overlap_left = max(src_left, t_left)
-                t_overlap_right = min(src_right, t_right)
-                if t_overlap_left < t_overlap_right:
-                    overlapping_targets.append(t)
-
+            # Boxes overlap and no obstructions. No other target needs fan-out,
+            # so every target of this source overlaps it as well.
             # Distribute ports within the overlap region for overlapping targets
             overlap_width = overlap_right - overlap_left
-            overlap_count = len(overlapping_targets)
-            overlap_idx = overlapping_targets.index(target)
+            overlap_count = len(source_targets)
+            overlap_idx = port_idx[0]
 
             if overlap_count == 1:
                 # Single overlapping target - use center of overlap
@@ -394,14 +581,14 @@ class EdgeDrawer:
             # No horizontal overlap or boxes in path - use distributed ports
             # Source: exit from bottom
             src_port_count = len(source_targets)
-            src_port_idx = source_targets.index(target)
+            src_port_idx = port_idx[0]
             src_port_x = self.position_calculator.calculate_port_x(
                 src_x, src_dims.width, src_port_idx, src_port_count
             )
 
             # Target: enter from top
             tgt_port_count = len(target_sources)
-            tgt_port_idx = target_sources.index(source)
+            tgt_port_idx = port_idx[1]
             tgt_port_x = self.position_calculator.calculate_port_x(
                 tgt_x, tgt_dims.width, tgt_port_idx, tgt_port_count
             )
@@ -433,7 +620,7 @@ class EdgeDrawer:
             route_x = max_right_x + 2  # Go 2 chars to the right of all boxes
 
             # Use the mid_y from source layer for the first horizontal segment
-            mid_y = self._get_safe_horizontal_y(layer_boundaries, src_layer, start_y)
+            mid_y = self._get_safe_horizontal_y(gap_middles, src_layer, start_y)
 
             # Vertical from source to mid
             self._draw_vertical_line(canvas, src_port_x, start_y, mid_y - 1)
@@ -452,9 +639,7 @@ class EdgeDrawer:
             )
 
             # Find the y position for the horizontal segment above the target
-            tgt_mid_y = self._get_safe_horizontal_y(
-                layer_boundaries, tgt_layer - 1, start_y
-            )
+            tgt_mid_y = self._get_safe_horizontal_y(gap_middles, tgt_layer - 1, start_y)
 
             # Vertical segment down the right side
             self._draw_vertical_line(canvas, route_x, mid_y + 1, tgt_mid_y - 1)
@@ -498,9 +683,7 @@ class EdgeDrawer:
                 safe_x = max(
                     x + dims.width + 2 for _, x, _, dims in boxes_in_vertical_path
                 )
-                mid_y = self._get_safe_horizontal_y(
-                    layer_boundaries, src_layer, start_y
-                )
+                mid_y = self._get_safe_horizontal_y(gap_middles, src_layer, start_y)
 
                 # Down from source to mid_y
                 self._draw_vertical_line(canvas, src_port_x, start_y, mid_y - 1)
@@ -512,7 +695,7 @@ class EdgeDrawer:
 
                 # Down past the blocking boxes
                 tgt_mid_y = self._get_safe_horizontal_y(
-                    layer_boundaries, tgt_layer - 1, start_y
+                    gap_middles, tgt_layer - 1, start_y
                 )
                 self._draw_vertical_line(canvas, safe_x, mid_y + 1, tgt_mid_y - 1)
                 self._set_corner(canvas, safe_x, tgt_mid_y, "bottom_right")
@@ -539,7 +722,7 @@ class EdgeDrawer:
             # Need to route with horizontal segment
             # Use layer-aware routing: place horizontal segment in the gap zone
             # below the source layer where no boxes can exist
-            mid_y = self._get_safe_horizontal_y(layer_boundaries, src_layer, start_y)
+            mid_y = self._get_safe_horizontal_y(gap_middles, src_layer, start_y)
 
             # Check if there are boxes in the horizontal segment path at mid_y
             horiz_min_x = min(src_port_x, tgt_port_x)
@@ -609,7 +792,7 @@ class EdgeDrawer:
 
                 # Down at route_x past blocking boxes
                 tgt_mid_y = self._get_safe_horizontal_y(
-                    layer_boundaries, tgt_layer - 1, start_y
+                    gap_middles, tgt_layer - 1, start_y
                 )
                 tgt_mid_y = max(
                     tgt_mid_y,
@@ -657,6 +840,7 @@ class EdgeDrawer:
         box_positions: Dict[str, Tuple[int, int]],
         source_targets: List[str],
         target_sources: List[str],
+        port_idx: Tuple[int, int],
         layout_result: LayoutResult,
     ) -> None:
         """
@@ -674,9 +858,9 @@ class EdgeDrawer:
 
         # Calculate port positions
         src_port_count = len(source_targets)
-        src_port_idx = source_targets.index(target)
+        src_port_idx = port_idx[0]
         tgt_port_count = len(target_sources)
-        tgt_port_idx = target_sources.index(source)
+        tgt_port_idx = port_idx[1]
 
         # Source: exit from TOP (since target is above)
         src_port_x = self.position_calculator.calculate_port_x(
@@ -811,6 +995,7 @@ class EdgeDrawer:
         box_positions: Dict[str, Tuple[int, int]],
         source_targets: List[str],
         target_sources: List[str],
+        port_idx: Tuple[int, int],
         layout_result: LayoutResult,
     ) -> None:
         """
@@ -862,9 +1047,9 @@ class EdgeDrawer:
 
         # Calculate vertical port positions
         src_port_count = len(source_targets)
-        src_port_idx = source_targets.index(target)
+        src_port_idx = port_idx[0]
         tgt_port_count = len(target_sources)
-        tgt_port_idx = target_sources.index(source)
+        tgt_port_idx = port_idx[1]
 
         src_port_y = self.position_calculator.calculate_port_y(
             src_y, src_dims.height, src_port_idx, src_port_count
@@ -1003,7 +1188,7 @@ class EdgeDrawer:
 
     def _get_safe_horizontal_y(
         self,
-        layer_boundaries: List[LayerBoundary],
+        gap_middles: List[int],
         src_layer: int,
         start_y: int,
     ) -> int:
@@ -1014,26 +1199,24 @@ class EdgeDrawer:
         ensuring it doesn't pass through any boxes.
 
         Args:
-            layer_boundaries: List of layer boundary information.
+            gap_middles: Middle y-coordinate of each layer's gap zone.
             src_layer: The layer index of the source node.
             start_y: The y-coordinate where the edge starts (below source box).
 
         Returns:
             A y-coordinate in the gap zone that's safe for horizontal routing.
         """
-        if src_layer < len(layer_boundaries):
-            boundary = layer_boundaries[src_layer]
-            # Place horizontal line in the middle of the gap zone
-            gap_middle = (boundary.gap_start_y + boundary.gap_end_y) // 2
-            # Ensure we're at least at start_y (below the source shadow)
-            return max(gap_middle, start_y + 1)
+        if src_layer < len(gap_middles):
+            # Place horizontal line in the middle of the gap zone, but at
+            # least at start_y (below the source shadow)
+            return max(gap_middles[src_layer], start_y + 1)
         else:
             # Fallback: just below the start
             return start_y + 2
 
     def _get_safe_vertical_x(
         self,
-        column_boundaries: List[ColumnBoundary],
+        gap_middles: List[int],
         src_layer: int,
         start_x: int,
     ) -> int:
@@ -1044,19 +1227,17 @@ class EdgeDrawer:
         layer, ensuring it doesn't pass through any boxes.
 
         Args:
-            column_boundaries: List of column boundary information.
+            gap_middles: Middle x-coordinate of each column's gap zone.
             src_layer: The layer index of the source node.
             start_x: The x-coordinate where the edge starts (after source box).
 
         Returns:
             An x-coordinate in the gap zone that's safe for vertical routing.
         """
-        if src_layer < len(column_boundaries):
-            boundary = column_boundaries[src_layer]
-            # Place vertical line in the middle of the gap zone
-            gap_middle = (boundary.gap_start_x + boundary.gap_end_x) // 2
-            # Ensure we're at least at start_x (after the source shadow)
-            return max(gap_middle, start_x + 1)
+        if src_layer < len(gap_middles):
+            # Place vertical line in the middle of the gap zone, but at
+            # least at start_x (after the source shadow)
+            return max(gap_middles[src_layer], start_x + 1)
         else:
             # Fallback: just after the start
             return start_x + 2
@@ -1079,35 +1260,23 @@ class EdgeDrawer:
         if y_start > y_end:
             y_start, y_end = y_end, y_start
 
+        # A column span clear of boxes is merged as one run
+        if self._column_span_is_clear(x, y_start, y_end + 1):
+            canvas.merge_vline(
+                x, y_start, y_end + 1, _VERTICAL_MERGE, _VERTICAL_MERGE_REASONS
+            )
+            return
+
         for y in range(y_start, y_end + 1):
             # Skip if this position is inside a box or on a box border
             if self._is_inside_box(x, y) or self._is_on_box_border(x, y):
                 continue
 
             current = canvas.get(x, y)
-            if current == LINE_CHARS["horizontal"]:
-                canvas.set(x, y, LINE_CHARS["cross"], "vertical_crosses_horizontal")
-            elif current in (
-                LINE_CHARS["corner_top_left"],
-                LINE_CHARS["corner_bottom_left"],
-            ):
-                # Corners with "right" segment + vertical = tee_right
-                # corner_top_left (┌) has: down, right -> + up, down = tee_right (├)
-                # corner_bottom_left (└) has: up, right -> + up, down = tee_right (├)
-                canvas.set(x, y, LINE_CHARS["tee_right"], "upgrade_corner_to_tee")
-            elif current in (
-                LINE_CHARS["corner_top_right"],
-                LINE_CHARS["corner_bottom_right"],
-            ):
-                # Corners with "left" segment + vertical = tee_left
-                # corner_top_right (┐) has: down, left -> + up, down = tee_left (┤)
-                # corner_bottom_right (┘) has: up, left -> + up, down = tee_left (┤)
-                canvas.set(x, y, LINE_CHARS["tee_left"], "upgrade_corner_to_tee")
-            elif current in (LINE_CHARS["tee_up"], LINE_CHARS["tee_down"]):
-                # Tees with horizontal segments + vertical = cross
-                canvas.set(x, y, LINE_CHARS["cross"], "upgrade_tee_to_cross")
-            elif current == " " or current == BOX_CHARS["shadow"]:
-                canvas.set(x, y, LINE_CHARS["vertical"], "vertical_line")
+            if current in _VERTICAL_MERGE:
+                canvas.set(
+                    x, y, _VERTICAL_MERGE[current], _VERTICAL_MERGE_REASONS[current]
+                )
 
     def _draw_horizontal_line(
         self, canvas: Canvas, x_start: int, x_end: int, y: int
@@ -1127,41 +1296,23 @@ class EdgeDrawer:
         if x_start > x_end:
             x_start, x_end = x_end, x_start
 
+        # A row span clear of boxes is merged as one run
+        if self._row_span_is_clear(x_start + 1, x_end, y):
+            canvas.merge_hline(
+                x_start + 1, x_end, y, _HORIZONTAL_MERGE, _HORIZONTAL_MERGE_REASONS
+            )
+            return
+
         for x in range(x_start + 1, x_end):
             # Skip if this position is inside a box or on a box border
             if self._is_inside_box(x, y) or self._is_on_box_border(x, y):
                 continue
 
             current = canvas.get(x, y)
-            if current == LINE_CHARS["vertical"]:
-                canvas.set(x, y, LINE_CHARS["cross"], "horizontal_crosses_vertical")
-            elif current in (
-                LINE_CHARS["corner_top_left"],
-                LINE_CHARS["corner_top_right"],
-            ):
-                # Corners with "down" segment + horizontal = tee_down
-                # corner_top_left (┌) has: down, right -> + left, right = tee_down (┬)
-                # corner_top_right (┐) has: down, left -> + left, right = tee_down (┬)
-                canvas.set(x, y, LINE_CHARS["tee_down"], "upgrade_corner_to_tee")
-            elif current in (
-                LINE_CHARS["corner_bottom_left"],
-                LINE_CHARS["corner_bottom_right"],
-            ):
-                # Corners with "up" segment + horizontal = tee_up
-                # corner_bottom_left (└) has: up, right -> + left, right = tee_up (┴)
-                # corner_bottom_right (┘) has: up, left -> + left, right = tee_up (┴)
-                canvas.set(x, y, LINE_CHARS["tee_up"], "upgrade_corner_to_tee")
-            elif current in (LINE_CHARS["tee_right"], LINE_CHARS["tee_left"]):
-                # Tees with vertical segments + horizontal = cross
-                canvas.set(x, y, LINE_CHARS["cross"], "upgrade_vertical_tee_to_cross")
-            elif current in (LINE_CHARS["tee_up"], LINE_CHARS["tee_down"]):
-                # These tees already have horizontal connectivity, no change needed
-                pass
-            elif current == LINE_CHARS["horizontal"]:
-                # Already horizontal, no change needed
-                pass
-            elif current == " " or current == BOX_CHARS["shadow"]:
-                canvas.set(x, y, LINE_CHARS["horizontal"], "horizontal_line")
+            if current in _HORIZONTAL_MERGE:
+                canvas.set(
+                    x, y, _HORIZONTAL_MERGE[current], _HORIZONTAL_MERGE_REASONS[current]
+                )
 
     def _set_corner(self, canvas: Canvas, x: int, y: int, corner_type: str) -> None:
         """
@@ -1183,7 +1334,7 @@ class EdgeDrawer:
         current = canvas.get(x, y)
         corner_char = LINE_CHARS[f"corner_{corner_type}"]
 
-        if current in (" ", BOX_CHARS["shadow"]):
+        if current in _EMPTY_CELLS:
             canvas.set(x, y, corner_char, f"corner_{corner_type}")
         elif current == LINE_CHARS["horizontal"]:
             # Horizontal line + corner = tee pointing up or down
@@ -1310,7 +1461,7 @@ class EdgeDrawer:
         margin_x = 2  # Starting route column for back edges
 
         # Sort back edges by source layer (draw deeper ones first)
-        node_layer = {name: node.layer for name, node in layout_result.nodes.items()}
+        node_layer = layout_result.node_layers
 
         sorted_back_edges = sorted(
             layout_result.back_edges,
@@ -1332,7 +1483,7 @@ class EdgeDrawer:
 
             # Use offset margin for multiple back edges
             route_x = margin_x + margin_offset
-            margin_offset += 3  # Space out multiple back edges (increased for clarity)
+            margin_offset += BACK_EDGE_LANE_WIDTH  # Space out multiple back edges
 
             # Track how many edges already entered this target
             entry_idx = target_entry_count.get(target, 0)
@@ -1371,26 +1522,23 @@ class EdgeDrawer:
 
             # Draw the back edge path:
             # 1. Mark exit on source bottom-left corner area
-            exit_x = src_x + 1 + (margin_offset - 3)  # Offset exit point too
+            # Offset exit point too
+            exit_x = src_x + 1 + margin_offset - BACK_EDGE_LANE_WIDTH
             if exit_x >= src_x + src_dims.width - 1:
                 exit_x = src_x + 1
 
             canvas.set(exit_x, exit_border_y, LINE_CHARS["tee_down"])
 
             # 2. Short vertical line down from source (through shadow)
-            for y in range(exit_border_y + 1, exit_below_y + 1):
-                canvas.set(exit_x, y, LINE_CHARS["vertical"])
+            canvas.vline(
+                exit_x, exit_border_y + 1, exit_below_y + 1, LINE_CHARS["vertical"]
+            )
 
             # 3. Corner turning left
             canvas.set(exit_x, exit_below_y, LINE_CHARS["corner_bottom_right"])
 
             # 4. Horizontal line left to margin
-            for x in range(route_x + 1, exit_x):
-                current = canvas.get(x, exit_below_y)
-                if current == LINE_CHARS["vertical"]:
-                    canvas.set(x, exit_below_y, LINE_CHARS["cross"])
-                elif current == " " or current == BOX_CHARS["shadow"]:
-                    canvas.set(x, exit_below_y, LINE_CHARS["horizontal"])
+            canvas.merge_hline(route_x + 1, exit_x, exit_below_y, _HORIZONTAL_OVERLAY)
 
             # 5. Corner at margin (turning up)
             canvas.set(route_x, exit_below_y, LINE_CHARS["corner_bottom_left"])
@@ -1415,74 +1563,44 @@ class EdgeDrawer:
                     approach_x = route_x + 4
 
                 # 6a. Vertical line up the margin to safe_y
-                for y in range(safe_y + 1, exit_below_y):
-                    current = canvas.get(route_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(route_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(route_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(route_x, safe_y + 1, exit_below_y, _VERTICAL_OVERLAY)
 
                 # 7a. Corner at safe_y (turning right)
                 canvas.set(route_x, safe_y, LINE_CHARS["corner_top_left"])
 
                 # 8a. Horizontal line to approach position
-                for x in range(route_x + 1, approach_x):
-                    current = canvas.get(x, safe_y)
-                    if current == LINE_CHARS["vertical"]:
-                        canvas.set(x, safe_y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, safe_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(route_x + 1, approach_x, safe_y, _HORIZONTAL_OVERLAY)
 
                 # 9a. Corner turning down toward target
                 canvas.set(approach_x, safe_y, LINE_CHARS["corner_top_right"])
 
                 # 10a. Vertical line down to entry level
-                for y in range(safe_y + 1, entry_y):
-                    current = canvas.get(approach_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(approach_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(approach_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(approach_x, safe_y + 1, entry_y, _VERTICAL_OVERLAY)
 
                 # 11a. Corner at entry_y turning right to target
                 canvas.set(approach_x, entry_y, LINE_CHARS["corner_bottom_left"])
 
                 # 12a. Horizontal line to arrow position
-                for x in range(approach_x + 1, entry_x - 1):
-                    current = canvas.get(x, entry_y)
-                    if current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, entry_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(
+                    approach_x + 1, entry_x - 1, entry_y, _HORIZONTAL_FILL
+                )
 
                 # 13a. Arrow
                 canvas.set(entry_x - 1, entry_y, ARROW_CHARS["right"])
             else:
                 # No boxes in path - draw directly
                 # 6. Vertical line up the margin
-                for y in range(entry_y + 1, exit_below_y):
-                    current = canvas.get(route_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(route_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(route_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(
+                    route_x, entry_y + 1, exit_below_y, _VERTICAL_OVERLAY
+                )
 
                 # 7. Corner at target level (turning right)
-                current = canvas.get(route_x, entry_y)
-                if current == LINE_CHARS["vertical"]:
-                    canvas.set(route_x, entry_y, LINE_CHARS["tee_right"])
-                elif current == LINE_CHARS["horizontal"]:
-                    canvas.set(route_x, entry_y, LINE_CHARS["tee_down"])
-                elif current == " " or current == BOX_CHARS["shadow"]:
-                    canvas.set(route_x, entry_y, LINE_CHARS["corner_top_left"])
+                canvas.merge_cell(route_x, entry_y, _MARGIN_TURN_RIGHT)
 
                 # 8. Horizontal line from margin to target
-                for x in range(route_x + 1, entry_x - 1):
-                    current = canvas.get(x, entry_y)
-                    if current == LINE_CHARS["vertical"]:
-                        canvas.set(x, entry_y, LINE_CHARS["cross"])
-                    elif current == LINE_CHARS["corner_top_left"]:
-                        canvas.set(x, entry_y, LINE_CHARS["tee_down"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, entry_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(
+                    route_x + 1, entry_x - 1, entry_y, _HORIZONTAL_OVERLAY_TEE
+                )
 
                 # 9. Arrow one column before target box
                 canvas.set(entry_x - 1, entry_y, ARROW_CHARS["right"])
@@ -1510,16 +1628,22 @@ class EdgeDrawer:
         # Set box regions to avoid when drawing lines
         self._set_box_regions(box_positions, box_dimensions)
 
-        # Build lookup for node layers
-        node_layer = {name: node.layer for name, node in layout_result.nodes.items()}
+        node_layer = layout_result.node_layers
+
+        # Middle of each column's gap zone, shared by every edge routed through it
+        gap_middles = [(b.gap_start_x + b.gap_end_x) // 2 for b in column_boundaries]
 
-        # Group edges by source to allocate ports properly
-        edges_from: Dict[str, List[str]] = {}
-        edges_to: Dict[str, List[str]] = {}
+        # Group edges by source to allocate ports properly, staging the
+        # forward edges with their layers resolved so they are only
+        # filtered once
+        edges_from: Dict[str, List[str]] = defaultdict(list)
+        edges_to: Dict[str, List[str]] = defaultdict(list)
+        forward_edges: List[Tuple[str, str, int, int]] = []
 
+        back_edges = layout_result.back_edges
         for source, target in layout_result.edges:
             # Skip back edges
-            if (source, target) in layout_result.back_edges:
+            if (source, target) in back_edges:
                 continue
 
             src_layer = node_layer.get(source, 0)
@@ -1529,12 +1653,8 @@ class EdgeDrawer:
             if tgt_layer <= src_layer:
                 continue
 
-            if source not in edges_from:
-                edges_from[source] = []
+            forward_edges.append((source, target, src_layer, tgt_layer))
             edges_from[source].append(target)
-
-            if target not in edges_to:
-                edges_to[target] = []
             edges_to[target].append(source)
 
         # Sort edges for consistent port allocation (by vertical position)
@@ -1542,27 +1662,24 @@ class EdgeDrawer:
             edges_from[source].sort(key=lambda t: box_positions[t][1])
         for target in edges_to:
             edges_to[target].sort(key=lambda s: box_positions[s][1])
+        port_indices = self._port_indices(edges_from, edges_to)
+        fanout_targets = self._fanout_targets(
+            edges_from, box_positions, box_dimensions, horizontal=True
+        )
 
         # Draw each forward edge
-        for source, target in layout_result.edges:
-            if (source, target) in layout_result.back_edges:
-                continue
-
-            src_layer = node_layer.get(source, 0)
-            tgt_layer = node_layer.get(target, 0)
-
-            if tgt_layer <= src_layer:
-                continue
-
+        for source, target, src_layer, tgt_layer in forward_edges:
             self._draw_edge_horizontal(
                 canvas,
                 source,
                 target,
                 box_dimensions,
                 box_positions,
-                edges_from.get(source, []),
-                edges_to.get(target, []),
-                column_boundaries,
+                edges_from[source],
+                edges_to[target],
+                port_indices[source, target],
+                fanout_targets[source],
+                gap_middles,
                 src_layer,
                 tgt_layer,
                 layout_result,
@@ -1577,7 +1694,9 @@ class EdgeDrawer:
         box_positions: Dict[str, Tuple[int, int]],
         source_targets: List[str],
         target_sources: List[str],
-        column_boundaries: List[ColumnBoundary],
+        port_idx: Tuple[int, int],
+        fanout_targets: Set[str],
+        gap_middles: List[int],
         src_layer: int,
         tgt_layer: int,
         layout_result: LayoutResult,
@@ -1587,10 +1706,12 @@ class EdgeDrawer:
         tgt_dims = box_dimensions[target]
         src_x, src_y = box_positions[source]
         tgt_x, tgt_y = box_positions[target]
+        src_width, src_height = src_dims.width, src_dims.height
+        tgt_height = tgt_dims.height
 
         # Check if target is actually to the right of source (accounting for box width)
         # This can fail when nodes are grouped and stacked vertically
-        src_right = src_x + src_dims.width + (1 if self.shadow else 0)
+        src_right = src_x + src_width + (1 if self.shadow else 0)
         target_is_right_of_source = tgt_x > src_right
 
         if not target_is_right_of_source:
@@ -1605,6 +1726,7 @@ class EdgeDrawer:
                 box_positions,
                 source_targets,
                 target_sources,
+                port_idx,
                 layout_result,
             )
             return
@@ -1612,9 +1734,9 @@ class EdgeDrawer:
         # Check if boxes overlap vertically (inside borders)
         # For compact boxes (height 3), there's only one content row at y+1
         src_top = src_y + 1
-        src_bottom = src_y + src_dims.height - 2
+        src_bottom = src_y + src_height - 2
         tgt_top = tgt_y + 1
-        tgt_bottom = tgt_y + tgt_dims.height - 2
+        tgt_bottom = tgt_y + tgt_height - 2
 
         # Ensure bottom >= top for single-row content
         if src_bottom < src_top:
@@ -1633,7 +1755,7 @@ class EdgeDrawer:
         boxes_in_path = False
         if has_overlap:
             # Calculate the path region
-            path_x_min = src_x + src_dims.width  # After source
+            path_x_min = src_x + src_width  # After source
             path_x_max = tgt_x  # Before target
             path_y_min = min(overlap_top, overlap_bottom) - 1
             path_y_max = max(overlap_top, overlap_bottom) + 1
@@ -1650,50 +1772,29 @@ class EdgeDrawer:
             )
             boxes_in_path = len(blocking_boxes) > 0
 
+            if not boxes_in_path and len(source_targets) == 1:
+                # Fast path: the only edge leaving this source, with a clear
+                # run between vertically overlapping boxes, is a straight line
+                # through the middle of the overlap
+                port_y = (overlap_top + overlap_bottom) // 2
+                self._draw_horizontal_line(
+                    canvas, src_x + src_width - 1, tgt_x - 1, port_y
+                )
+                canvas.set(tgt_x - 1, port_y, ARROW_CHARS["right"])
+                return
+
         # Check if other targets from this source require fan-out routing
         # If so, we should use fan-out routing for ALL edges to avoid crossing
-        other_targets_need_fanout = False
-        if len(source_targets) > 1:
-            for t in source_targets:
-                if t == target:
-                    continue
-                t_dims = box_dimensions[t]
-                t_x, t_y = box_positions[t]
-                t_top = t_y + 1
-                t_bottom = t_y + t_dims.height - 2
-                # Adjust for compact boxes with single content row
-                if t_bottom < t_top:
-                    t_bottom = t_top
-                t_overlap_top = max(src_top, t_top)
-                t_overlap_bottom = min(src_bottom, t_bottom)
-                # Use > for NO overlap (opposite of <= check)
-                if t_overlap_top > t_overlap_bottom:
-                    # This target has no vertical overlap, will use fan-out routing
-                    other_targets_need_fanout = True
-                    break
+        other_targets_need_fanout = any(t != target for t in fanout_targets)
 
         if has_overlap and not boxes_in_path and not other_targets_need_fanout:
-            # Boxes overlap vertically and no obstructions
-            overlapping_targets = []
-            for t in source_targets:
-                t_dims = box_dimensions[t]
-                t_x, t_y = box_positions[t]
-                t_top = t_y + 1
-                t_bottom = t_y + t_dims.height - 2
-                # Adjust for compact boxes with single content row
-                if t_bottom < t_top:
-                    t_bottom = t_top
-                t_overlap_top = max(src_top, t_top)
-                t_overlap_bottom = min(src_bottom, t_bottom)
-                # Use <= for single-row overlap (compact boxes)
-                if t_overlap_top <= t_overlap_bottom:
-                    overlapping_targets.append(t)
-
+            # Boxes overlap vertically and no obstructions. No other target
+            # needs fan-out, so every target of this source overlaps it as well.
             # Distribute ports within the overlap region
             # For compact boxes, overlap_height may be 0, so use at least 1
             overlap_height = max(1, overlap_bottom - overlap_top)
-            overlap_count = len(overlapping_targets)
-            overlap_idx = overlapping_targets.index(target)
+            overlap_count = len(source_targets)
+            overlap_idx = port_idx[0]
 
             if overlap_count == 1:
                 port_y = (overlap_top + overlap_bottom) // 2
@@ -1711,19 +1812,19 @@ class EdgeDrawer:
         else:
             # No vertical overlap or boxes in path - use distributed ports
             src_port_count = len(source_targets)
-            src_port_idx = source_targets.index(target)
+            src_port_idx = port_idx[0]
             src_port_y = self.position_calculator.calculate_port_y(
-                src_y, src_dims.height, src_port_idx, src_port_count
+                src_y, src_height, src_port_idx, src_port_count
             )
 
             tgt_port_count = len(target_sources)
-            tgt_port_idx = target_sources.index(source)
+            tgt_port_idx = port_idx[1]
             tgt_port_y = self.position_calculator.calculate_port_y(
-                tgt_y, tgt_dims.height, tgt_port_idx, tgt_port_count
+                tgt_y, tgt_height, tgt_port_idx, tgt_port_count
             )
 
         # Exit from right side of source box
-        src_port_x = src_x + src_dims.width - 1
+        src_port_x = src_x + src_width - 1
         # Enter left side of target box
         tgt_port_x = tgt_x
 
@@ -1737,7 +1838,7 @@ class EdgeDrawer:
         # Check if we need to route around boxes
         if boxes_in_path:
             # Route below all boxes to avoid crossing them
-            max_bottom_y = src_y + src_dims.height
+            max_bottom_y = src_y + src_height
             for layer_idx in range(src_layer + 1, tgt_layer):
                 for node_name in layout_result.layers[layer_idx]:
                     node_dims = box_dimensions[node_name]
@@ -1749,7 +1850,7 @@ class EdgeDrawer:
             route_y = max_bottom_y + 2  # Go 2 rows below all boxes
 
             # Use the mid_x from source layer for the first vertical segment
-            mid_x = self._get_safe_vertical_x(column_boundaries, src_layer, start_x)
+            mid_x = self._get_safe_vertical_x(gap_middles, src_layer, start_x)
 
             # Horizontal from source to mid
             self._draw_horizontal_line(canvas, start_x - 1, mid_x, src_port_y)
@@ -1764,9 +1865,7 @@ class EdgeDrawer:
             self._set_corner(canvas, mid_x, route_y, "bottom_left")
 
             # Find the x position for the vertical segment before the target
-            tgt_mid_x = self._get_safe_vertical_x(
-                column_boundaries, tgt_layer - 1, start_x
-            )
+            tgt_mid_x = self._get_safe_vertical_x(gap_middles, tgt_layer - 1, start_x)
 
             # Horizontal segment below boxes
             self._draw_horizontal_line(canvas, mid_x, tgt_mid_x, route_y)
@@ -1798,7 +1897,7 @@ class EdgeDrawer:
             # Need to route with vertical segment
             # Use column-aware routing: place vertical segment in the gap zone
             # to the right of the source layer where no boxes can exist
-            mid_x = self._get_safe_vertical_x(column_boundaries, src_layer, start_x)
+            mid_x = self._get_safe_vertical_x(gap_middles, src_layer, start_x)
 
             # Horizontal from source to mid
             # Adjust for exclusive endpoints: start_x - 1 so line begins at start_x,
@@ -1811,7 +1910,7 @@ class EdgeDrawer:
                 # to connect the two horizontal segments. Other edges going up/down
                 # will convert this to appropriate tees via _set_corner.
                 current = canvas.get(mid_x, src_port_y)
-                if current in (" ", BOX_CHARS["shadow"]):
+                if current in _EMPTY_CELLS:
                     canvas.set(mid_x, src_port_y, LINE_CHARS["horizontal"])
                 # If there's already something there, _set_corner from other edges
                 # will have handled it correctly
@@ -1859,6 +1958,7 @@ class EdgeDrawer:
         box_positions: Dict[str, Tuple[int, int]],
         source_targets: List[str],
         target_sources: List[str],
+        port_idx: Tuple[int, int],
         layout_result: LayoutResult,
     ) -> None:
         """
@@ -1912,9 +2012,9 @@ class EdgeDrawer:
 
         # Calculate horizontal port positions
         src_port_count = len(source_targets)
-        src_port_idx = source_targets.index(target)
+        src_port_idx = port_idx[0]
         tgt_port_count = len(target_sources)
-        tgt_port_idx = target_sources.index(source)
+        tgt_port_idx = port_idx[1]
 
         def calculate_port_x(
             box_x: int, box_width: int, port_idx: int, port_count: int
@@ -2063,7 +2163,7 @@ class EdgeDrawer:
         margin_y = 2 + title_height  # Starting route row for back edges
 
         # Sort back edges by source layer (draw deeper ones first)
-        node_layer = {name: node.layer for name, node in layout_result.nodes.items()}
+        node_layer = layout_result.node_layers
 
         sorted_back_edges = sorted(
             layout_result.back_edges,
@@ -2085,7 +2185,7 @@ class EdgeDrawer:
 
             # Use offset margin for multiple back edges
             route_y = margin_y + margin_offset
-            margin_offset += 3  # Space out multiple back edges (increased for clarity)
+            margin_offset += BACK_EDGE_LANE_WIDTH  # Space out multiple back edges
 
             # Track how many edges already entered this target
             entry_idx = target_entry_count.get(target, 0)
@@ -2125,7 +2225,7 @@ class EdgeDrawer:
 
             # Draw the back edge path:
             # 1. Mark exit on source right side near top
-            exit_y = src_y + 1 + (margin_offset - 3)
+            exit_y = src_y + 1 + margin_offset - BACK_EDGE_LANE_WIDTH
             if exit_y >= src_y + src_dims.height - 1:
                 exit_y = src_y + 1
 
@@ -2164,21 +2264,15 @@ class EdgeDrawer:
                 turn_up_x = max_blocking_right + 1
 
                 # 2a. Horizontal line right from source to turn_up_x
-                for x in range(exit_border_x + 1, turn_up_x):
-                    current = canvas.get(x, exit_y)
-                    if current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, exit_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(
+                    exit_border_x + 1, turn_up_x, exit_y, _HORIZONTAL_FILL
+                )
 
                 # 3a. Corner turning up at turn_up_x
                 canvas.set(turn_up_x, exit_y, LINE_CHARS["corner_bottom_right"])
 
                 # 4a. Vertical line up to margin
-                for y in range(route_y + 1, exit_y):
-                    current = canvas.get(turn_up_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(turn_up_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(turn_up_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(turn_up_x, route_y + 1, exit_y, _VERTICAL_OVERLAY)
 
                 # 5a. Corner at margin (turning left)
                 canvas.set(turn_up_x, route_y, LINE_CHARS["corner_top_right"])
@@ -2188,30 +2282,24 @@ class EdgeDrawer:
             else:
                 # No boxes in ascent path - draw directly
                 # 2. Short horizontal line right from source (through shadow)
-                for x in range(exit_border_x + 1, exit_right_x + 1):
-                    canvas.set(x, exit_y, LINE_CHARS["horizontal"])
+                canvas.hline(
+                    exit_border_x + 1,
+                    exit_right_x + 1,
+                    exit_y,
+                    LINE_CHARS["horizontal"],
+                )
 
                 # 3. Corner turning up (line enters from left, exits upward)
                 canvas.set(exit_right_x, exit_y, LINE_CHARS["corner_bottom_right"])
 
                 # 4. Vertical line up to margin
-                for y in range(route_y + 1, exit_y):
-                    current = canvas.get(exit_right_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(exit_right_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(exit_right_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(exit_right_x, route_y + 1, exit_y, _VERTICAL_OVERLAY)
 
                 # 5. Corner at margin (turning left)
                 canvas.set(exit_right_x, route_y, LINE_CHARS["corner_top_right"])
 
             # 6. Horizontal line left along the margin
-            for x in range(entry_x + 1, exit_right_x):
-                current = canvas.get(x, route_y)
-                if current == LINE_CHARS["vertical"]:
-                    canvas.set(x, route_y, LINE_CHARS["cross"])
-                elif current == " " or current == BOX_CHARS["shadow"]:
-                    canvas.set(x, route_y, LINE_CHARS["horizontal"])
+            canvas.merge_hline(entry_x + 1, exit_right_x, route_y, _HORIZONTAL_OVERLAY)
 
             if boxes_in_descent_path:
                 # Need to route around boxes
@@ -2235,54 +2323,36 @@ class EdgeDrawer:
 
                 # Continue horizontal line from entry_x to turn_down_x
                 # (the original line was drawn from exit_right_x to entry_x+1)
-                for x in range(turn_down_x + 1, entry_x + 1):
-                    current = canvas.get(x, route_y)
-                    if current == LINE_CHARS["vertical"]:
-                        canvas.set(x, route_y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, route_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(
+                    turn_down_x + 1, entry_x + 1, route_y, _HORIZONTAL_OVERLAY
+                )
 
                 # 7a. Corner at turn_down_x, route_y (turning down)
                 canvas.set(turn_down_x, route_y, LINE_CHARS["corner_top_left"])
 
                 # 8a. Vertical line down to target_entry_y
-                for y in range(route_y + 1, target_entry_y):
-                    current = canvas.get(turn_down_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(turn_down_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(turn_down_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(
+                    turn_down_x, route_y + 1, target_entry_y, _VERTICAL_OVERLAY
+                )
 
                 # 9a. Corner at turn_down_x, target_entry_y (turning right)
                 corner_char = LINE_CHARS["corner_bottom_left"]
                 canvas.set(turn_down_x, target_entry_y, corner_char)
 
                 # 10a. Horizontal line to arrow position
-                for x in range(turn_down_x + 1, tgt_x - 1):
-                    current = canvas.get(x, target_entry_y)
-                    if current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(x, target_entry_y, LINE_CHARS["horizontal"])
+                canvas.merge_hline(
+                    turn_down_x + 1, tgt_x - 1, target_entry_y, _HORIZONTAL_FILL
+                )
 
                 # 11a. Arrow (entering from left)
                 canvas.set(tgt_x - 1, target_entry_y, ARROW_CHARS["right"])
             else:
                 # No boxes in path - draw directly
                 # 7. Corner at target column (turning down)
-                current = canvas.get(entry_x, route_y)
-                if current == LINE_CHARS["horizontal"]:
-                    canvas.set(entry_x, route_y, LINE_CHARS["tee_down"])
-                elif current == LINE_CHARS["vertical"]:
-                    canvas.set(entry_x, route_y, LINE_CHARS["tee_down"])
-                elif current == " " or current == BOX_CHARS["shadow"]:
-                    canvas.set(entry_x, route_y, LINE_CHARS["corner_top_left"])
+                canvas.merge_cell(entry_x, route_y, _MARGIN_TURN_DOWN)
 
                 # 8. Vertical line from margin to target (stop before arrow)
-                for y in range(route_y + 1, entry_y - 1):
-                    current = canvas.get(entry_x, y)
-                    if current == LINE_CHARS["horizontal"]:
-                        canvas.set(entry_x, y, LINE_CHARS["cross"])
-                    elif current == " " or current == BOX_CHARS["shadow"]:
-                        canvas.set(entry_x, y, LINE_CHARS["vertical"])
+                canvas.merge_vline(entry_x, route_y + 1, entry_y - 1, _VERTICAL_OVERLAY)
 
                 # 9. Arrow one row above target box
                 canvas.set(entry_x, entry_y - 1, ARROW_CHARS["down"])
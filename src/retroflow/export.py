@@ -10,7 +10,7 @@ font loading, image rendering, and file I/O.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -34,6 +34,17 @@ class FlowchartExporter:
             default_font: Default font name for PNG export (e.g., "Cascadia Code").
         """
         self.default_font = default_font
+        # Loaded fonts keyed by (font_name, font_size), reused across exports
+        self._font_cache: Dict[Tuple[Optional[str], int], ImageFont.FreeTypeFont] = {}
+        # First fallback font candidate that loaded, tried before the
+        # candidates that are known to fail when other sizes are loaded
+        self._resolved_font: Optional[str] = None
+        # Rasterized glyph masks per loaded font, reused across PNG exports
+        self._glyph_cache: Dict[
+            ImageFont.FreeTypeFont, Dict[str, Optional[Tuple[int, int, Image.Image]]]
+        ] = {}
+        # Reference cell metrics (char width, char height, advance) per font
+        self._metrics_cache: Dict[ImageFont.FreeTypeFont, Tuple[int, int, float]] = {}
 
     def save_txt(self, flowchart: str, filename: str) -> None:
         """
@@ -56,6 +67,7 @@ class FlowchartExporter:
         padding: int = 20,
         font: Optional[str] = None,
         scale: int = 2,
+        compress_level: int = 6,
     ) -> None:
         """
         Save flowchart as a high-resolution PNG image.
@@ -72,6 +84,8 @@ class FlowchartExporter:
             padding: Padding around the diagram in pixels.
             font: Font name to use (overrides default_font if provided).
             scale: Resolution multiplier for crisp output (default 2 for retina).
+            compress_level: zlib compression level for the PNG, from 0 (none,
+                fastest) to 9 (smallest file, slowest).
 
         Example:
             >>> exporter = FlowchartExporter(default_font="Cascadia Code")
@@ -86,16 +100,14 @@ class FlowchartExporter:
         loaded_font = self._load_monospace_font(scaled_font_size, font_name)
 
         # Calculate character dimensions using a reference character
-        bbox = loaded_font.getbbox("M")
-        char_width = bbox[2] - bbox[0]
-        char_height = bbox[3] - bbox[1]
+        char_width, char_height, advance = self._font_metrics(loaded_font)
         line_height = int(char_height * 1.2)  # Add some line spacing
 
         # Scale padding to match resolution
         scaled_padding = padding * scale
 
         # Calculate image dimensions
-        max_line_len = max(len(line) for line in lines) if lines else 0
+        max_line_len = max(map(len, lines), default=0)
         img_width = char_width * max_line_len + scaled_padding * 2
         img_height = line_height * len(lines) + scaled_padding * 2
 
@@ -105,16 +117,118 @@ class FlowchartExporter:
 
         # Create image and draw text
         img = Image.new("RGB", (img_width, img_height), bg_color)
-        draw = ImageDraw.Draw(img)
 
-        y = scaled_padding
-        for line in lines:
-            draw.text((scaled_padding, y), line, font=loaded_font, fill=fg_color)
-            y += line_height
+        if advance == int(advance):
+            # Fixed integer advance: rasterize each distinct glyph once and
+            # stamp it at its grid cell instead of laying out every line.
+            self._draw_glyph_grid(
+                img,
+                lines,
+                loaded_font,
+                fg_color,
+                scaled_padding,
+                int(advance),
+                line_height,
+            )
+        else:
+            # Draw line by line: multiline_text() splits and lays out each
+            # line itself anyway, so it saves no FreeType work.
+            draw = ImageDraw.Draw(img)
+            y = scaled_padding
+            for line in lines:
+                if line.strip():
+                    draw.text(
+                        (scaled_padding, y), line, font=loaded_font, fill=fg_color
+                    )
+                y += line_height
 
         # Save the image
         output_path = Path(filename)
-        img.save(output_path, "PNG")
+        img.save(output_path, "PNG", compress_level=compress_level)
+
+    def _font_metrics(
+        self, loaded_font: ImageFont.FreeTypeFont
+    ) -> Tuple[int, int, float]:
+        """
+        Measure the reference character cell of a font, once per font.
+
+        Args:
+            loaded_font: The loaded font to measure.
+
+        Returns:
+            Tuple of (char_width, char_height, advance) for "M".
+        """
+        metrics = self._metrics_cache.get(loaded_font)
+        if metrics is None:
+            x0, y0, x1, y1 = loaded_font.getbbox("M")
+            metrics = (x1 - x0, y1 - y0, loaded_font.getlength("M"))
+            self._metrics_cache[loaded_font] = metrics
+        return metrics
+
+    def _draw_glyph_grid(
+        self,
+        img: Image.Image,
+        lines: List[str],
+        loaded_font: ImageFont.FreeTypeFont,
+        fg_color: str,
+        padding: int,
+        advance: int,
+        line_height: int,
+    ) -> None:
+        """
+        Draw text by stamping pre-rendered glyph masks onto a character grid.
+
+        Each distinct character is rasterized once into an "L" mask cropped to
+        its bounding box. The masks of a row are pasted at their grid cells
+        into one row mask, which is then drawn in fg_color with a single fill.
+        Pasting blends overlapping antialiased edges the same way
+        ImageDraw.text() composes a line, so for a monospace font with an
+        integer advance the result is identical to drawing each line with it.
+
+        Args:
+            img: Image to draw onto.
+            lines: Rows of the ASCII flowchart.
+            loaded_font: Font used to rasterize the glyphs.
+            fg_color: Foreground/text color.
+            padding: Offset of the first cell from the top-left corner.
+            advance: Horizontal advance of a single character in pixels.
+            line_height: Vertical distance between rows in pixels.
+        """
+        # Glyph masks keyed by character: (bbox x offset, bbox y offset, mask).
+        # Fonts are cached, so the masks carry over to later exports too.
+        glyphs = self._glyph_cache.setdefault(loaded_font, {})
+
+        draw = ImageDraw.Draw(img)
+        y = padding
+        for line in lines:
+            placed = []
+            for col, char in enumerate(line):
+                if char != " ":
+                    if char not in glyphs:
+                        glyphs[char] = self._render_glyph(char, loaded_font)
+                    glyph = glyphs[char]
+                    if glyph is not None:
+                        placed.append((padding + col * advance, glyph))
+            if placed:
+                # Compose the row's glyphs into one mask, then fill it once
+                top = min(y0 for _, (_, y0, _) in placed)
+                bottom = max(y0 + mask.height for _, (_, y0, mask) in placed)
+                row_mask = Image.new("L", (img.width, bottom - top), 0)
+                for x, (x0, y0, mask) in placed:
+                    row_mask.paste(255, (x + x0, y0 - top), mask)
+                draw.bitmap((0, y + top), row_mask, fill=fg_color)
+            y += line_height
+
+    def _render_glyph(
+        self, char: str, loaded_font: ImageFont.FreeTypeFont
+    ) -> Optional[Tuple[int, int, Image.Image]]:
+        """Rasterize a single character, or return None if it has no ink."""
+        x0, y0, x1, y1 = loaded_font.getbbox(char)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+        ImageDraw.Draw(mask).text((-x0, -y0), char, font=loaded_font, fill=255)
+        return x0, y0, mask
 
     def _load_monospace_font(
         self, font_size: int, font_name: Optional[str] = None
@@ -127,6 +241,9 @@ class FlowchartExporter:
         2. Common system monospace fonts
         3. Pillow's default font
 
+        Loaded fonts are cached per (font_name, font_size), so repeated exports
+        don't search the font candidates again.
+
         Args:
             font_size: Font size in points.
             font_name: Optional font name (e.g., "Cascadia Code", "Monaco").
@@ -134,6 +251,19 @@ class FlowchartExporter:
         Returns:
             A PIL ImageFont object.
         """
+        cache_key = (font_name, font_size)
+        cached = self._font_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loaded_font = self._find_monospace_font(font_size, font_name)
+        self._font_cache[cache_key] = loaded_font
+        return loaded_font
+
+    def _find_monospace_font(
+        self, font_size: int, font_name: Optional[str] = None
+    ) -> ImageFont.FreeTypeFont:
+        """Search the font candidates for the first one that loads."""
         # Build list of fonts to try
         fonts_to_try = []
 
@@ -141,6 +271,10 @@ class FlowchartExporter:
         if font_name:
             fonts_to_try.append(font_name)
 
+        # Then the fallback that worked last time, if any
+        if self._resolved_font:
+            fonts_to_try.append(self._resolved_font)
+
         # Common monospace fonts across different systems
         fonts_to_try.extend(
             [
@@ -163,9 +297,12 @@ class FlowchartExporter:
 
         for font in fonts_to_try:
             try:
-                return ImageFont.truetype(font, font_size)
+                loaded_font = ImageFont.truetype(font, font_size)
             except OSError:
                 continue
+            if font != font_name:
+                self._resolved_font = font
+            return loaded_font
 
         # Fall back to Pillow's default font
         try:
@@ -30,15 +30,21 @@ Debug Mode Example:
     >>> print(trace.summary())
 """
 
-from typing import Dict, List, Optional, Tuple, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
+from .cache import LRUCache
 from .debug import TracedCanvas
 from .edge_drawing import EdgeDrawer
-from .export import FlowchartExporter
 from .layout import LayoutResult, NetworkXLayout
 from .models import ColumnBoundary, GroupBoundary, LayerBoundary
 from .parser import Parser
-from .positioning import PositionCalculator
+from .positioning import (
+    BACK_EDGE_LANE_WIDTH,
+    BACK_EDGE_MARGIN_BASE,
+    GROUP_EDGE_MARGIN,
+    PositionCalculator,
+)
 from .renderer import (
     BoxDimensions,
     BoxRenderer,
@@ -48,6 +54,12 @@ from .renderer import (
 )
 from .tracer import RenderTrace
 
+if TYPE_CHECKING:
+    from .export import FlowchartExporter
+
+# Number of rendered flowcharts each generator keeps for repeated requests
+RENDER_CACHE_SIZE = 32
+
 
 class FlowchartGenerator:
     """
@@ -133,11 +145,25 @@ class FlowchartGenerator:
             position_calculator=self.position_calculator,
             shadow=shadow,
         )
-        self.exporter = FlowchartExporter(default_font=font)
 
         # Debug trace storage (populated when debug=True in generate())
         self._last_trace: Optional[RenderTrace] = None
 
+        # Recently rendered flowcharts, evicted least recently used first
+        self._render_cache: "LRUCache[Tuple, str]" = LRUCache(RENDER_CACHE_SIZE)
+
+    @cached_property
+    def exporter(self) -> "FlowchartExporter":
+        """
+        File exporter, created on first use.
+
+        Importing the exporter pulls in PIL, so generators that only render
+        strings never pay for it.
+        """
+        from .export import FlowchartExporter
+
+        return FlowchartExporter(default_font=self.font)
+
     def get_trace(self) -> Optional[RenderTrace]:
         """
         Get the trace from the last generate() call with debug=True.
@@ -155,7 +181,10 @@ class FlowchartGenerator:
         return self._last_trace
 
     def generate(
-        self, input_text: str, title: Optional[str] = None, debug: bool = False
+        self,
+        input_text: str,
+        title: Optional[str] = None,
+        debug: Union[bool, str] = False,
     ) -> str:
         """
         Generate an ASCII flowchart from input text.
@@ -163,17 +192,26 @@ class FlowchartGenerator:
         Args:
             input_text: Multi-line string with connections like "A -> B".
             title: Optional title to display (overrides instance title).
-            debug: If True, capture detailed trace information about the
-                   rendering process. Access via get_trace() after calling.
+            debug: If truthy, capture detailed trace information about the
+                   rendering process, including every character placement.
+                   Use "stages" to capture only the pipeline stages and
+                   canvas snapshots, without tracing every character. Any
+                   other truthy value (True, "chars", 1, ...) gives the full
+                   trace. Access via get_trace() after calling.
 
         Returns:
             ASCII art flowchart as a string.
 
+        Rendered flowcharts are cached per generator, so repeating a call with
+        the same input and title (for example save_txt() followed by
+        save_png()) returns the stored result without re-running the pipeline.
+
         Debug Mode:
             When debug=True, a detailed trace is captured that includes:
             - Pipeline stages (parse, layout, positions, etc.)
             - Canvas snapshots at each stage
             - Every character placement with coordinates and reasons
+              (skipped with debug="stages", which renders much faster)
 
             Access the trace via get_trace() after calling generate():
 
@@ -183,17 +221,86 @@ class FlowchartGenerator:
             >>> print(trace.summary())
             >>> trace.dump_to_file("debug_trace.txt")
         """
-        # Initialize debug trace if requested
+        # Use provided title or fall back to instance title
+        effective_title = title if title is not None else self.title
+        cache_key = (input_text, effective_title, *self._render_settings())
+
+        # Initialize debug trace if requested; traced runs always render so
+        # the trace is populated
         trace: Optional[RenderTrace] = None
         if debug:
             trace = RenderTrace(input_text=input_text, direction=self.direction)
             self._last_trace = trace
         else:
             self._last_trace = None
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        # Use provided title or fall back to instance title
-        effective_title = title if title is not None else self.title
+        result = self._render(
+            input_text, effective_title, trace, trace_chars=debug != "stages"
+        )
+
+        self._render_cache.put(cache_key, result)
+        return result
+
+    def _render_settings(self) -> Tuple:
+        """
+        Collect every component setting a render depends on, for the cache key.
+
+        The settings are read from the component objects rather than the
+        constructor arguments, so adjusting a component after construction
+        (for example swapping box_renderer.box_chars) misses the cache instead
+        of returning a stale render. Character sets are keyed by content, so
+        editing one in place is noticed too.
 
+        Returns:
+            Tuple of direction plus the box, group, title, positioning and
+            edge drawing settings.
+        """
+        box = self.box_renderer
+        group_box = self.group_box_renderer
+        title = self.title_renderer
+        calculator = self.position_calculator
+        return (
+            self.direction,
+            box.max_text_width,
+            box.padding,
+            box.shadow,
+            box.compact,
+            tuple(box.box_chars.items()),
+            group_box.shadow,
+            tuple(group_box.chars.items()),
+            title.padding,
+            title.max_line_width,
+            tuple(title.box_chars.items()),
+            calculator.min_box_width,
+            calculator.horizontal_spacing,
+            calculator.vertical_spacing,
+            calculator.shadow,
+            self.edge_drawer.shadow,
+        )
+
+    def _render(
+        self,
+        input_text: str,
+        effective_title: Optional[str],
+        trace: Optional[RenderTrace],
+        trace_chars: bool = True,
+    ) -> str:
+        """
+        Run the full pipeline and render the flowchart to a string.
+
+        Args:
+            input_text: Multi-line string with connections like "A -> B".
+            effective_title: Title to display, or None for no title.
+            trace: RenderTrace to record into, or None when not debugging.
+            trace_chars: Whether to record every character placement in the
+                trace, or only the pipeline stages.
+
+        Returns:
+            ASCII art flowchart as a string.
+        """
         # Parse input (including groups)
         parse_result = self.parser.parse_with_groups(input_text)
         connections = parse_result.connections
@@ -241,15 +348,17 @@ class FlowchartGenerator:
             )
 
         # Calculate actual pixel positions - leave margin for back edges
-        # Each back edge needs 3 chars of space, plus 4 for min line before arrow
+        # Each back edge needs its own lane, plus a minimum line before arrow
         num_back_edges = len(layout_result.back_edges)
-        back_edge_margin = (4 + num_back_edges * 3) if num_back_edges > 0 else 0
+        back_edge_margin = (
+            BACK_EDGE_MARGIN_BASE + num_back_edges * BACK_EDGE_LANE_WIDTH
+            if num_back_edges > 0
+            else 0
+        )
 
         # Add extra margin if groups are present to ensure edges don't run
         # too close to group boundaries
         if groups:
-            from .positioning import GROUP_EDGE_MARGIN
-
             back_edge_margin = max(back_edge_margin, GROUP_EDGE_MARGIN + 2)
 
         if groups:
@@ -308,11 +417,11 @@ class FlowchartGenerator:
         group_y_offset = 0
 
         if groups:
-            temp_boundaries = self.position_calculator.calculate_group_boundaries(
+            group_boundaries = self.position_calculator.calculate_group_boundaries(
                 groups, box_positions, box_dimensions
             )
             # Find minimum x/y to determine offset needed
-            for gb in temp_boundaries:
+            for gb in group_boundaries:
                 if gb.x < 0:
                     group_x_offset = max(group_x_offset, abs(gb.x))
                 if gb.y < 0:
@@ -320,44 +429,9 @@ class FlowchartGenerator:
 
         # Apply group offset to box positions if needed
         if group_x_offset > 0 or group_y_offset > 0:
-            box_positions = {
-                name: (x + group_x_offset, y + group_y_offset)
-                for name, (x, y) in box_positions.items()
-            }
-            # Recalculate group boundaries with offset positions
-            if groups:
-                group_boundaries = self.position_calculator.calculate_group_boundaries(
-                    groups, box_positions, box_dimensions
-                )
-            # Offset layer boundaries for TB mode
-            layer_boundaries = [
-                LayerBoundary(
-                    layer_idx=lb.layer_idx,
-                    top_y=lb.top_y + group_y_offset,
-                    bottom_y=lb.bottom_y + group_y_offset,
-                    gap_start_y=lb.gap_start_y + group_y_offset,
-                    gap_end_y=lb.gap_end_y + group_y_offset,
-                )
-                for lb in layer_boundaries
-            ]
-            # Offset column boundaries for LR mode
-            if self.direction == "LR":
-                column_boundaries = [
-                    ColumnBoundary(
-                        layer_idx=cb.layer_idx,
-                        left_x=cb.left_x + group_x_offset,
-                        right_x=cb.right_x + group_x_offset,
-                        gap_start_x=cb.gap_start_x + group_x_offset,
-                        gap_end_x=cb.gap_end_x + group_x_offset,
-                    )
-                    for cb in column_boundaries
-                ]
-        else:
-            # Just calculate group boundaries with current positions
-            if groups:
-                group_boundaries = self.position_calculator.calculate_group_boundaries(
-                    groups, box_positions, box_dimensions
-                )
+            box_positions, group_boundaries = self._offset_boxes(
+                box_positions, group_boundaries, group_x_offset, group_y_offset
+            )
 
         # Resolve any overlapping group boundaries
         if len(group_boundaries) >= 2:
@@ -373,18 +447,11 @@ class FlowchartGenerator:
             # Recalculate canvas size after overlap resolution
             # (groups may have been shifted)
 
-        # Calculate canvas size from nodes
+        # Calculate canvas size from nodes and group boxes
         canvas_width, canvas_height = self.position_calculator.calculate_canvas_size(
-            box_dimensions, box_positions
+            box_dimensions, box_positions, group_boundaries
         )
 
-        # Expand canvas to fit group boxes (which may extend beyond nodes)
-        for gb in group_boundaries:
-            group_right = gb.x + gb.width + (2 if self.shadow else 0)
-            group_bottom = gb.y + gb.height + (2 if self.shadow else 0)
-            canvas_width = max(canvas_width, group_right)
-            canvas_height = max(canvas_height, group_bottom)
-
         # Calculate title dimensions and offset
         title_height = 0
         title_width = 0
@@ -411,6 +478,10 @@ class FlowchartGenerator:
             canvas_width + 5, canvas_height + title_height + 5
         )
 
+        # Resolve tracing once; the drawing stages below branch on the flag
+        # and snapshot the unwrapped canvas
+        underlying = canvas
+        traced = False
         if trace:
             trace.add_stage(
                 "canvas_created",
@@ -422,11 +493,13 @@ class FlowchartGenerator:
                 canvas,
             )
             # Wrap canvas with TracedCanvas for character-level tracing
-            canvas = TracedCanvas(canvas, trace)
+            if trace_chars:
+                canvas = TracedCanvas(canvas, trace)
+                traced = True
 
         # Draw title if present, centered above the diagram
         if effective_title:
-            if isinstance(canvas, TracedCanvas):
+            if traced:
                 canvas.set_source("TitleRenderer.draw_title")
             self.title_renderer.draw_title(
                 canvas, title_x_offset, 0, effective_title, title_width
@@ -434,51 +507,26 @@ class FlowchartGenerator:
 
         # Offset box positions for title and centering
         if title_height > 0 or diagram_x_offset > 0:
-            box_positions = {
-                name: (x + diagram_x_offset, y + title_height)
-                for name, (x, y) in box_positions.items()
-            }
-            # Also offset layer boundaries by title height
-            if title_height > 0:
-                layer_boundaries = [
-                    LayerBoundary(
-                        layer_idx=lb.layer_idx,
-                        top_y=lb.top_y + title_height,
-                        bottom_y=lb.bottom_y + title_height,
-                        gap_start_y=lb.gap_start_y + title_height,
-                        gap_end_y=lb.gap_end_y + title_height,
-                    )
-                    for lb in layer_boundaries
-                ]
-                # And column boundaries for LR mode
-                if self.direction == "LR" and diagram_x_offset > 0:
-                    column_boundaries = [
-                        ColumnBoundary(
-                            layer_idx=cb.layer_idx,
-                            left_x=cb.left_x + diagram_x_offset,
-                            right_x=cb.right_x + diagram_x_offset,
-                            gap_start_x=cb.gap_start_x + diagram_x_offset,
-                            gap_end_x=cb.gap_end_x + diagram_x_offset,
-                        )
-                        for cb in column_boundaries
-                    ]
-
-        # Recalculate group boundaries after box positions are offset
-        if groups:
-            group_boundaries = self.position_calculator.calculate_group_boundaries(
-                groups, box_positions, box_dimensions
+            box_positions, group_boundaries = self._offset_boxes(
+                box_positions, group_boundaries, diagram_x_offset, title_height
             )
 
+        # Offset layer and column boundaries once by the combined group and
+        # title offsets; nothing reads them before drawing
+        layer_boundaries, column_boundaries = self._offset_boundaries(
+            layer_boundaries,
+            column_boundaries,
+            group_x_offset + diagram_x_offset,
+            group_y_offset + title_height,
+        )
+
         # Draw group boxes FIRST (so nodes appear on top)
         if group_boundaries:
-            if isinstance(canvas, TracedCanvas):
+            if traced:
                 canvas.set_source("GroupBoxRenderer.draw_group_box")
             self._draw_groups(canvas, group_boundaries)
 
             if trace:
-                underlying = (
-                    canvas._canvas if isinstance(canvas, TracedCanvas) else canvas
-                )
                 trace.add_stage(
                     "groups_drawn",
                     {
@@ -488,13 +536,11 @@ class FlowchartGenerator:
                 )
 
         # Draw node boxes
-        if isinstance(canvas, TracedCanvas):
+        if traced:
             canvas.set_source("BoxRenderer.draw_box")
         self._draw_boxes(canvas, box_dimensions, box_positions, layout_result)
 
         if trace:
-            # Get underlying canvas for snapshot
-            underlying = canvas._canvas if isinstance(canvas, TracedCanvas) else canvas
             trace.add_stage(
                 "boxes_drawn",
                 {
@@ -504,7 +550,7 @@ class FlowchartGenerator:
             )
 
         # Draw forward edges with layer-aware routing
-        if isinstance(canvas, TracedCanvas):
+        if traced:
             canvas.set_source("EdgeDrawer.draw_edges")
         if self.direction == "LR":
             self.edge_drawer.draw_edges_horizontal(
@@ -521,16 +567,12 @@ class FlowchartGenerator:
             )
 
         if trace:
-            underlying = canvas._canvas if isinstance(canvas, TracedCanvas) else canvas
+            back_edges = layout_result.back_edges
             trace.add_stage(
                 "forward_edges_drawn",
                 {
-                    "num_forward_edges": len(
-                        [
-                            e
-                            for e in layout_result.edges
-                            if e not in layout_result.back_edges
-                        ]
+                    "num_forward_edges": sum(
+                        e not in back_edges for e in layout_result.edges
                     ),
                 },
                 underlying,
@@ -538,7 +580,7 @@ class FlowchartGenerator:
 
         # Draw back edges along the margin
         if layout_result.back_edges:
-            if isinstance(canvas, TracedCanvas):
+            if traced:
                 canvas.set_source("EdgeDrawer.draw_back_edges")
             if self.direction == "LR":
                 self.edge_drawer.draw_back_edges_horizontal(
@@ -550,10 +592,6 @@ class FlowchartGenerator:
                 )
 
             if trace:
-                if isinstance(canvas, TracedCanvas):
-                    underlying = canvas._canvas
-                else:
-                    underlying = canvas
                 trace.add_stage(
                     "back_edges_drawn",
                     {
@@ -588,6 +626,7 @@ class FlowchartGenerator:
         padding: int = 20,
         font: Optional[str] = None,
         scale: int = 2,
+        compress_level: int = 6,
     ) -> None:
         """
         Generate flowchart and save as a high-resolution PNG image.
@@ -604,6 +643,8 @@ class FlowchartGenerator:
             padding: Padding around the diagram in pixels.
             font: Font name to use (overrides instance font if provided).
             scale: Resolution multiplier for crisp output (default 2 for retina).
+            compress_level: zlib compression level for the PNG, from 0 (none,
+                fastest) to 9 (smallest file, slowest).
 
         Example:
             >>> generator = FlowchartGenerator(font="Cascadia Code")
@@ -619,8 +660,80 @@ class FlowchartGenerator:
             padding=padding,
             font=font or self.font,
             scale=scale,
+            compress_level=compress_level,
         )
 
+    def _offset_boxes(
+        self,
+        box_positions: Dict[str, Tuple[int, int]],
+        group_boundaries: List[GroupBoundary],
+        dx: int,
+        dy: int,
+    ) -> Tuple[Dict[str, Tuple[int, int]], List[GroupBoundary]]:
+        """
+        Move every node box and group box by the same offset.
+
+        Args:
+            box_positions: Dictionary of box positions.
+            group_boundaries: List of group boundary information.
+            dx: Horizontal offset.
+            dy: Vertical offset.
+
+        Returns:
+            Tuple of (moved box_positions, moved group_boundaries).
+        """
+        box_positions = {
+            name: (x + dx, y + dy) for name, (x, y) in box_positions.items()
+        }
+        if group_boundaries:
+            group_boundaries = self.position_calculator.offset_group_boundaries(
+                group_boundaries, dx, dy
+            )
+        return box_positions, group_boundaries
+
+    def _offset_boundaries(
+        self,
+        layer_boundaries: List[LayerBoundary],
+        column_boundaries: List[ColumnBoundary],
+        dx: int,
+        dy: int,
+    ) -> Tuple[List[LayerBoundary], List[ColumnBoundary]]:
+        """
+        Move layer boundaries (TB) down and column boundaries (LR) right.
+
+        Args:
+            layer_boundaries: List of layer boundary information.
+            column_boundaries: List of column boundary information.
+            dx: Horizontal offset, applied to column boundaries.
+            dy: Vertical offset, applied to layer boundaries.
+
+        Returns:
+            Tuple of (moved layer_boundaries, moved column_boundaries).
+        """
+        if dy > 0:
+            layer_boundaries = [
+                LayerBoundary(
+                    layer_idx=lb.layer_idx,
+                    top_y=lb.top_y + dy,
+                    bottom_y=lb.bottom_y + dy,
+                    gap_start_y=lb.gap_start_y + dy,
+                    gap_end_y=lb.gap_end_y + dy,
+                )
+                for lb in layer_boundaries
+            ]
+        if dx > 0 and column_boundaries:
+            column_boundaries = [
+                ColumnBoundary(
+                    layer_idx=cb.layer_idx,
+                    left_x=cb.left_x + dx,
+                    right_x=cb.right_x + dx,
+                    gap_start_x=cb.gap_start_x + dx,
+                    gap_end_x=cb.gap_end_x + dx,
+                )
+                for cb in column_boundaries
+            ]
+        return layer_boundaries, column_boundaries
+
     def _draw_groups(
         self,
         canvas: Canvas,
@@ -661,7 +774,8 @@ class FlowchartGenerator:
             box_positions: Dictionary of box positions.
             layout_result: The layout result with node information.
         """
+        # Walk nodes in layout order so traced placements stay in that order
+        draw_box = self.box_renderer.draw_box
         for node_name in layout_result.nodes:
-            dims = box_dimensions[node_name]
             x, y = box_positions[node_name]
-            self.box_renderer.draw_box(canvas, x, y, dims)
+            draw_box(canvas, x, y, box_dimensions[node_name])
@@ -9,12 +9,14 @@ Uses networkx for:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 
+from .models import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class NodeLayout:
     """Represents a node's layout information."""
 
@@ -36,6 +38,7 @@ class LayoutResult:
     edges: List[Tuple[str, str]] = field(default_factory=list)
     back_edges: Set[Tuple[str, str]] = field(default_factory=set)
     has_cycles: bool = False
+    node_layers: Dict[str, int] = field(default_factory=dict)  # Node -> layer
 
 
 class NetworkXLayout:
@@ -67,19 +70,32 @@ class NetworkXLayout:
         self.graph = nx.DiGraph()
         self.graph.add_edges_from(connections)
 
-        # Check for cycles
-        has_cycles = not nx.is_directed_acyclic_graph(self.graph)
+        # Check for cycles; an acyclic graph's topological generations are
+        # its layers, so they are kept instead of computed a second time
+        generations: Optional[List[List[str]]] = None
+        try:
+            generations = [list(g) for g in nx.topological_generations(self.graph)]
+        except nx.NetworkXUnfeasible:
+            pass
+        has_cycles = generations is None
         self.back_edges = set()
 
         if has_cycles:
             # Find and remove back edges to create a DAG
             self._break_cycles()
 
+        # Layering and ordering both work on the graph without back edges;
+        # neither modifies it, so an acyclic graph needs no copy
+        dag = self.graph
+        if self.back_edges:
+            dag = self.graph.copy()
+            dag.remove_edges_from(self.back_edges)
+
         # Assign layers using topological generations
-        layers = self._assign_layers()
+        layers = self._assign_layers(dag, generations)
 
         # Order nodes within each layer to minimize crossings
-        layers = self._order_layers(layers)
+        layers = self._order_layers(layers, dag)
 
         # Build result
         result = LayoutResult()
@@ -94,6 +110,7 @@ class NetworkXLayout:
                 result.nodes[node_name] = NodeLayout(
                     name=node_name, layer=layer_idx, position=pos_idx
                 )
+                result.node_layers[node_name] = layer_idx
 
         return result
 
@@ -102,37 +119,40 @@ class NetworkXLayout:
         Identify back edges and create a DAG by conceptually removing them.
         Uses DFS to find back edges.
         """
-        # Find all cycles
-        try:
-            cycles = list(nx.simple_cycles(self.graph))
-        except Exception:
-            cycles = []
-
-        if not cycles:
-            return
-
+        # Only called once the topological check in _layout has found a
+        # cycle; on an acyclic graph the DFS below finds no back edges anyway
         # For each cycle, we need to identify one edge to "break"
         # We'll use a DFS-based approach to find back edges
         visited = set()
         rec_stack = set()
-
-        def dfs(node):
-            visited.add(node)
-            rec_stack.add(node)
-
-            for successor in list(self.graph.successors(node)):
-                if successor not in visited:
-                    dfs(successor)
-                elif successor in rec_stack:
-                    # This is a back edge
-                    self.back_edges.add((node, successor))
-
-            rec_stack.remove(node)
+        successors = self.graph.successors
+
+        def dfs(start):
+            # Iterative DFS with an explicit stack of (node, successor
+            # iterator) frames, so deep graphs cannot hit the recursion limit
+            visited.add(start)
+            rec_stack.add(start)
+            stack = [(start, successors(start))]
+
+            while stack:
+                node, children = stack[-1]
+                for successor in children:
+                    if successor not in visited:
+                        visited.add(successor)
+                        rec_stack.add(successor)
+                        stack.append((successor, successors(successor)))
+                        break
+                    if successor in rec_stack:
+                        # This is a back edge
+                        self.back_edges.add((node, successor))
+                else:
+                    stack.pop()
+                    rec_stack.remove(node)
 
         # Start DFS from nodes with no predecessors, or any node if all have them
-        roots = [n for n in self.graph.nodes() if self.graph.in_degree(n) == 0]
+        roots = [n for n, degree in self.graph.in_degree() if degree == 0]
         if not roots:
-            roots = [list(self.graph.nodes())[0]]
+            roots = [next(iter(self.graph))]
 
         for root in roots:
             if root not in visited:
@@ -143,31 +163,37 @@ class NetworkXLayout:
             if node not in visited:
                 dfs(node)
 
-    def _assign_layers(self) -> List[List[str]]:
+    def _assign_layers(
+        self,
+        working_graph: nx.DiGraph,
+        generations: Optional[List[List[str]]] = None,
+    ) -> List[List[str]]:
         """
         Assign nodes to layers using longest path method.
-        """
-        # Create a working graph without back edges
-        working_graph = self.graph.copy()
-        working_graph.remove_edges_from(self.back_edges)
 
-        # Use longest path for layer assignment
-        # This places nodes as far down as possible
-        node_layer: Dict[str, int] = {}
+        Each node sits one layer past its deepest predecessor, which is
+        exactly the graph's topological generations.
+
+        Args:
+            working_graph: The graph with back edges removed.
+            generations: Topological generations of working_graph, if already
+                known.
+        """
+        if generations is not None:
+            return generations
 
-        # Process in topological order
         try:
-            topo_order = list(nx.topological_sort(working_graph))
+            return [list(g) for g in nx.topological_generations(working_graph)]
         except nx.NetworkXUnfeasible:
-            # Still has cycles somehow, fall back to simple ordering
-            topo_order = list(working_graph.nodes())
+            pass
 
-        for node in topo_order:
-            predecessors = list(working_graph.predecessors(node))
-            if not predecessors:
-                node_layer[node] = 0
-            else:
-                node_layer[node] = max(node_layer.get(p, 0) for p in predecessors) + 1
+        # Still has cycles somehow, fall back to simple ordering
+        node_layer: Dict[str, int] = {}
+        predecessors = working_graph.pred
+        for node in working_graph.nodes():
+            node_layer[node] = (
+                max((node_layer.get(p, 0) for p in predecessors[node]), default=-1) + 1
+            )
 
         # Group by layer
         if not node_layer:
@@ -181,20 +207,25 @@ class NetworkXLayout:
 
         return layers
 
-    def _order_layers(self, layers: List[List[str]]) -> List[List[str]]:
+    def _order_layers(
+        self, layers: List[List[str]], working_graph: nx.DiGraph
+    ) -> List[List[str]]:
         """
         Order nodes within each layer to minimize edge crossings.
         Uses barycenter heuristic.
+
+        Args:
+            layers: Nodes of each layer, in their initial order.
+            working_graph: The graph with back edges removed.
         """
-        if len(layers) <= 1:
+        # With at most one node per layer there is nothing to reorder
+        if len(layers) <= 1 or max(map(len, layers)) <= 1:
             return layers
 
-        # Create working graph without back edges for ordering
-        working_graph = self.graph.copy()
-        working_graph.remove_edges_from(self.back_edges)
-
         # Multiple passes of barycenter ordering
         for _ in range(4):
+            before = list(layers)
+
             # Forward pass
             for i in range(1, len(layers)):
                 layers[i] = self._order_layer_by_barycenter(
@@ -207,6 +238,10 @@ class NetworkXLayout:
                     layers[i], layers[i + 1], working_graph, use_predecessors=False
                 )
 
+            # A pass that moved nothing would move nothing again
+            if layers == before:
+                break
+
         return layers
 
     def _order_layer_by_barycenter(
@@ -220,18 +255,18 @@ class NetworkXLayout:
         Order nodes by barycenter (average position of connected nodes).
         """
         ref_positions = {node: i for i, node in enumerate(ref_layer)}
+        layer_positions = {node: i for i, node in enumerate(layer)}
+        # Adjacency dicts are looked up once per layer, not per node
+        neighbors_of = graph.pred if use_predecessors else graph.succ
 
         def barycenter(node: str) -> float:
-            if use_predecessors:
-                neighbors = list(graph.predecessors(node))
-            else:
-                neighbors = list(graph.successors(node))
-
-            positions = [ref_positions[n] for n in neighbors if n in ref_positions]
+            positions = [
+                ref_positions[n] for n in neighbors_of[node] if n in ref_positions
+            ]
 
             if not positions:
                 # Keep original order for nodes with no connections to ref layer
-                return layer.index(node) if node in layer else 0
+                return layer_positions[node]
 
             return sum(positions) / len(positions)
 
@@ -13,11 +13,18 @@ Classes:
     GroupBoundary: Calculated boundaries for a rendered group box.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List
 
+# Dataclass options for records created in bulk on every render; __slots__
+# drops the per-instance __dict__ (dataclass slots need Python 3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LayerBoundary:
     """
     Boundary information for a horizontal layer in top-to-bottom (TB) mode.
@@ -40,7 +47,7 @@ class LayerBoundary:
     gap_end_y: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ColumnBoundary:
     """
     Boundary information for a vertical column in left-to-right (LR) mode.
@@ -82,7 +89,7 @@ class GroupDefinition:
     order: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GroupBoundary:
     """
     Calculated boundaries for a rendered group box.
@@ -5,11 +5,18 @@ Handles parsing of input text into graph connections and group definitions.
 """
 
 import re
-from dataclasses import dataclass, field
-from typing import List, Set, Tuple
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Set, Tuple
 
+from .cache import LRUCache
 from .models import GroupDefinition
 
+# Number of parsed inputs each parser keeps for repeated requests
+PARSE_CACHE_SIZE = 16
+
+# Trie key marking a complete node name; never clashes with a single character
+_TRIE_END = ""
+
 
 class ParseError(Exception):
     """Raised when input parsing fails."""
@@ -28,11 +35,15 @@ class ParseResult:
 class Parser:
     """Parses flowchart input text into connections and groups."""
 
-    # Regex for group definition: [GROUP NAME: node1 node2 node3]
+    # Specification of the group definition syntax: [GROUP NAME: node1 node2]
+    # Not used while parsing; _split_group_line implements exactly this match
+    # with string methods and is tested against it. Keep the two in step.
     GROUP_PATTERN = re.compile(r"^\s*\[([^:]+):\s*(.+)\]\s*$")
 
     def __init__(self):
         self.connections = []
+        # Recently parsed inputs, evicted least recently used first
+        self._parse_cache: "LRUCache[str, ParseResult]" = LRUCache(PARSE_CACHE_SIZE)
 
     def parse(self, input_text: str) -> List[Tuple[str, str]]:
         """
@@ -61,6 +72,33 @@ class Parser:
         1. First pass: Parse all edges to discover valid node names
         2. Second pass: Parse group definitions, matching against known nodes
 
+        Args:
+            input_text: Multi-line string with optional group definitions
+                        followed by connections in format "A -> B"
+
+        Returns:
+            ParseResult with connections and groups
+
+        Raises:
+            ParseError: If input format is invalid
+
+        Parsed inputs are cached per parser; each call returns fresh lists so
+        callers may modify the result without affecting the cache.
+        """
+        cached = self._parse_cache.get(input_text)
+        if cached is None:
+            cached = self._parse(input_text)
+            self._parse_cache.put(input_text, cached)
+
+        return ParseResult(
+            connections=list(cached.connections),
+            groups=[replace(g, members=list(g.members)) for g in cached.groups],
+        )
+
+    def _parse(self, input_text: str) -> ParseResult:
+        """
+        Parse input text without consulting the cache.
+
         Args:
             input_text: Multi-line string with optional group definitions
                         followed by connections in format "A -> B"
@@ -73,7 +111,8 @@ class Parser:
         """
         lines = input_text.strip().split("\n")
         connections: List[Tuple[str, str]] = []
-        group_lines: List[Tuple[int, str]] = []  # (line_num, line)
+        # (line_num, group name text, member text) from _split_group_line
+        group_lines: List[Tuple[int, str, str]] = []
         edge_started = False
 
         # First pass: separate group lines from edge lines and parse edges
@@ -84,14 +123,16 @@ class Parser:
             if not stripped or stripped.startswith("#"):
                 continue
 
-            # Check if this is a group definition
-            if self.GROUP_PATTERN.match(stripped):
+            # Check if this is a group definition; the split is kept so group
+            # parsing does not repeat it
+            group_parts = self._split_group_line(stripped)
+            if group_parts is not None:
                 if edge_started:
                     raise ParseError(
                         f"Line {line_num}: Group definitions must appear before "
                         f"edge definitions: {stripped}"
                     )
-                group_lines.append((line_num, stripped))
+                group_lines.append((line_num, *group_parts))
                 continue
 
             # This is an edge definition
@@ -124,23 +165,50 @@ class Parser:
         if not connections:
             raise ParseError("No valid connections found in input")
 
-        # Collect all known node names from edges
-        all_nodes = self.get_all_nodes(connections)
-        all_nodes_set = set(all_nodes)
+        # Collect all known node names from edges; matching only needs a set
+        all_nodes_set = self._collect_nodes(connections)
 
         # Second pass: parse group definitions
         groups = self._parse_groups(group_lines, all_nodes_set)
 
         return ParseResult(connections=connections, groups=groups)
 
+    @staticmethod
+    def _split_group_line(line: str) -> Optional[Tuple[str, str]]:
+        """
+        Split a stripped line of the form [NAME: members] into its parts.
+
+        Accepts exactly the lines GROUP_PATTERN matches and returns the same
+        two groups, using string methods instead of the regex engine.
+
+        Args:
+            line: Input line with surrounding whitespace already removed.
+
+        Returns:
+            Tuple of (group name text, member text), or None if the line is
+            not a group definition.
+        """
+        if not (line.startswith("[") and line.endswith("]")):
+            return None
+        colon = line.find(":")
+        # The name needs at least one character before the first colon and
+        # the members at least one character before the closing bracket
+        if colon < 2 or colon >= len(line) - 2:
+            return None
+        member_text = line[colon + 1 : -1]
+        # Leading whitespace goes to the separator, but one character must
+        # remain for the member group
+        return line[1:colon], member_text.lstrip() or member_text[-1]
+
     def _parse_groups(
-        self, group_lines: List[Tuple[int, str]], known_nodes: Set[str]
+        self, group_lines: List[Tuple[int, str, str]], known_nodes: Set[str]
     ) -> List[GroupDefinition]:
         """
         Parse group definitions, matching member names against known nodes.
 
         Args:
-            group_lines: List of (line_num, line) tuples for group definitions.
+            group_lines: List of (line_num, group name text, member text)
+                tuples for group definitions.
             known_nodes: Set of valid node names from edges.
 
         Returns:
@@ -152,15 +220,15 @@ class Parser:
         groups: List[GroupDefinition] = []
         node_to_group: dict = {}  # Track which group each node belongs to
 
-        for order, (line_num, line) in enumerate(group_lines):
-            match = self.GROUP_PATTERN.match(line)
-            if not match:
-                raise ParseError(
-                    f"Line {line_num}: Invalid group definition format: {line}"
-                )
+        if not group_lines:
+            return groups
+
+        # Built once and shared by every group's member matching
+        trie = self._build_node_trie(known_nodes)
 
-            group_name = match.group(1).strip()
-            member_text = match.group(2).strip()
+        for order, (line_num, name_text, member_text) in enumerate(group_lines):
+            group_name = name_text.strip()
+            member_text = member_text.strip()
 
             if not group_name:
                 raise ParseError(f"Line {line_num}: Empty group name")
@@ -168,7 +236,7 @@ class Parser:
                 raise ParseError(f"Line {line_num}: Empty member list for group")
 
             # Match member names against known nodes using greedy longest-match
-            members = self._match_node_names(member_text, known_nodes)
+            members = self._match_node_names(member_text, known_nodes, trie)
 
             if not members:
                 raise ParseError(
@@ -191,7 +259,32 @@ class Parser:
 
         return groups
 
-    def _match_node_names(self, member_text: str, known_nodes: Set[str]) -> List[str]:
+    @staticmethod
+    def _build_node_trie(known_nodes: Set[str]) -> dict:
+        """
+        Build a character trie of node names for longest-match lookups.
+
+        Args:
+            known_nodes: Set of valid node names.
+
+        Returns:
+            Nested dicts keyed by character; a complete name is stored under
+            the _TRIE_END key of its last character's dict.
+        """
+        trie: dict = {}
+        for node in known_nodes:
+            level = trie
+            for char in node:
+                level = level.setdefault(char, {})
+            level[_TRIE_END] = node
+        return trie
+
+    def _match_node_names(
+        self,
+        member_text: str,
+        known_nodes: Set[str],
+        trie: Optional[dict] = None,
+    ) -> List[str]:
         """
         Match member text against known node names using greedy longest-first.
 
@@ -201,34 +294,42 @@ class Parser:
         Args:
             member_text: Space-separated text from group definition.
             known_nodes: Set of valid node names.
+            trie: Trie of known_nodes from _build_node_trie, built here if
+                not given.
 
         Returns:
             List of matched node names in order of appearance.
         """
+        if trie is None:
+            trie = self._build_node_trie(known_nodes)
+
         members: List[str] = []
         remaining = member_text.strip()
 
-        # Sort known nodes by length (descending) for greedy matching
-        sorted_nodes = sorted(known_nodes, key=len, reverse=True)
-
         while remaining:
             remaining = remaining.lstrip()
             if not remaining:
                 break
 
-            matched = False
-            for node in sorted_nodes:
-                if remaining.startswith(node):
-                    # Check that the match ends at a word boundary
-                    end_idx = len(node)
-                    if end_idx == len(remaining) or remaining[end_idx] == " ":
-                        if node not in members:  # Avoid duplicates within same group
-                            members.append(node)
-                        remaining = remaining[end_idx:].lstrip()
-                        matched = True
-                        break
-
-            if not matched:
+            # Walk the trie along the text, keeping the longest node name that
+            # ends at a word boundary
+            matched = None
+            level = trie
+            for idx, char in enumerate(remaining):
+                level = level.get(char)
+                if level is None:
+                    break
+                end_idx = idx + 1
+                if _TRIE_END in level and (
+                    end_idx == len(remaining) or remaining[end_idx] == " "
+                ):
+                    matched = level[_TRIE_END]
+
+            if matched is not None:
+                if matched not in members:  # Avoid duplicates within same group
+                    members.append(matched)
+                remaining = remaining[len(matched) :].lstrip()
+            else:
                 # Skip the current word if no match found
                 space_idx = remaining.find(" ")
                 if space_idx == -1:
@@ -247,11 +348,20 @@ class Parser:
         Returns:
             Sorted list of unique node names
         """
-        nodes = set()
-        for source, target in connections:
-            nodes.add(source)
-            nodes.add(target)
-        return sorted(nodes)
+        return sorted(self._collect_nodes(connections))
+
+    @staticmethod
+    def _collect_nodes(connections: List[Tuple[str, str]]) -> Set[str]:
+        """
+        Collect the unique node names from connections, unordered.
+
+        Args:
+            connections: List of (source, target) tuples
+
+        Returns:
+            Set of unique node names
+        """
+        return {node for connection in connections for node in connection}
 
 
 def parse_flowchart(input_text: str) -> List[Tuple[str, str]]:
@@ -12,7 +12,9 @@ The PositionCalculator class centralizes these calculations and is used by the
 FlowchartGenerator to determine where each element should be placed.
 """
 
-from typing import Dict, List, Set, Tuple
+from dataclasses import replace
+from itertools import accumulate
+from typing import Dict, List, Optional, Set, Tuple
 
 from .layout import LayoutResult
 from .models import ColumnBoundary, GroupBoundary, GroupDefinition, LayerBoundary
@@ -24,6 +26,10 @@ GROUP_EXTERNAL_MARGIN = 4  # Space between group box and adjacent elements
 GROUP_TITLE_HEIGHT = 1  # Height reserved for group title
 GROUP_EDGE_MARGIN = 3  # Minimum space between edges and group borders
 
+# Back edges run in a margin beside the diagram, one lane per edge
+BACK_EDGE_LANE_WIDTH = 3  # Space between adjacent back-edge lanes
+BACK_EDGE_MARGIN_BASE = 4  # Minimum line length before the entry arrow
+
 
 class PositionCalculator:
     """
@@ -63,6 +69,9 @@ class PositionCalculator:
         self.horizontal_spacing = horizontal_spacing
         self.vertical_spacing = vertical_spacing
         self.shadow = shadow
+        # Box dimensions per node label, valid for _dim_cache_settings
+        self._dim_cache: Dict[str, BoxDimensions] = {}
+        self._dim_cache_settings: Tuple = ()
 
     def calculate_all_box_dimensions(
         self, layout_result: LayoutResult
@@ -76,19 +85,36 @@ class PositionCalculator:
         Returns:
             Dictionary mapping node names to their BoxDimensions.
         """
+        # Dimensions depend on these settings; drop cached ones if they changed
+        renderer = self.box_renderer
+        settings = (
+            self.min_box_width,
+            renderer.max_text_width,
+            renderer.padding,
+            renderer.compact,
+        )
+        if settings != self._dim_cache_settings:
+            self._dim_cache = {}
+            self._dim_cache_settings = settings
+        dim_cache = self._dim_cache
+
         dimensions = {}
 
         for node_name in layout_result.nodes:
-            dims = self.box_renderer.calculate_box_dimensions(node_name)
-
-            # Ensure minimum width
-            if dims.width < self.min_box_width:
-                dims = BoxDimensions(
-                    width=self.min_box_width,
-                    height=dims.height,
-                    text_lines=dims.text_lines,
-                    padding=dims.padding,
-                )
+            dims = dim_cache.get(node_name)
+            if dims is None:
+                dims = renderer.calculate_box_dimensions(node_name)
+
+                # Ensure minimum width
+                if dims.width < self.min_box_width:
+                    dims = BoxDimensions(
+                        width=self.min_box_width,
+                        height=dims.height,
+                        text_lines=dims.text_lines,
+                        padding=dims.padding,
+                    )
+
+                dim_cache[node_name] = dims
 
             dimensions[node_name] = dims
 
@@ -114,56 +140,48 @@ class PositionCalculator:
             Dictionary mapping node names to (x, y) positions.
         """
         positions: Dict[str, Tuple[int, int]] = {}
-
-        # Calculate dimensions for each layer
-        layer_heights: List[int] = []
-        layer_widths: List[List[int]] = []
-
-        for layer in layout_result.layers:
-            max_height = 0
-            widths = []
-
-            for node_name in layer:
-                dims = box_dimensions[node_name]
-                # Include shadow in height calculation
-                box_height = dims.height + (2 if self.shadow else 0)
-                max_height = max(max_height, box_height)
-                # Include shadow in width calculation
-                box_width = dims.width + (1 if self.shadow else 0)
-                widths.append(box_width)
-
-            layer_heights.append(max_height)
-            layer_widths.append(widths)
+        layers = layout_result.layers
+        spacing = self.horizontal_spacing
+
+        # Calculate dimensions for each layer, including shadows
+        shadow_height = 2 if self.shadow else 0
+        shadow_width = 1 if self.shadow else 0
+        layer_heights = [
+            max((box_dimensions[n].height + shadow_height for n in layer), default=0)
+            for layer in layers
+        ]
+        layer_widths = [
+            [box_dimensions[n].width + shadow_width for n in layer] for layer in layers
+        ]
 
         # Calculate cumulative y positions (top of each layer)
-        y_positions: List[int] = [0]
-        for height in layer_heights[:-1]:
-            y_positions.append(y_positions[-1] + height + self.vertical_spacing)
+        y_positions = list(
+            accumulate(
+                (height + self.vertical_spacing for height in layer_heights[:-1]),
+                initial=0,
+            )
+        )
 
         # Calculate total width of each layer
-        layer_total_widths = []
-        for widths in layer_widths:
-            if widths:
-                total = sum(widths) + self.horizontal_spacing * (len(widths) - 1)
-            else:
-                total = 0
-            layer_total_widths.append(total)
+        layer_total_widths = [
+            sum(widths) + spacing * (len(widths) - 1) if widths else 0
+            for widths in layer_widths
+        ]
 
         # Find maximum layer width for centering
-        max_layer_width = max(layer_total_widths) if layer_total_widths else 0
+        max_layer_width = max(layer_total_widths, default=0)
 
         # Assign x,y positions
-        for layer_idx, layer in enumerate(layout_result.layers):
-            widths = layer_widths[layer_idx]
-            total_width = layer_total_widths[layer_idx]
-
+        for layer, widths, total_width, y in zip(
+            layers, layer_widths, layer_total_widths, y_positions
+        ):
             # Center this layer, plus left margin for back edges
             start_x = left_margin + (max_layer_width - total_width) // 2
-
-            current_x = start_x
-            for pos_idx, node_name in enumerate(layer):
-                positions[node_name] = (current_x, y_positions[layer_idx])
-                current_x += widths[pos_idx] + self.horizontal_spacing
+            x_positions = accumulate(
+                (width + spacing for width in widths[:-1]), initial=start_x
+            )
+            for node_name, x in zip(layer, x_positions):
+                positions[node_name] = (x, y)
 
         return positions
 
@@ -187,56 +205,49 @@ class PositionCalculator:
             Dictionary mapping node names to (x, y) positions.
         """
         positions: Dict[str, Tuple[int, int]] = {}
-
-        # Calculate dimensions for each layer (now columns)
-        layer_widths: List[int] = []  # Max width per layer (column)
-        layer_heights: List[List[int]] = []  # Heights of nodes in each layer
-
-        for layer in layout_result.layers:
-            max_width = 0
-            heights = []
-
-            for node_name in layer:
-                dims = box_dimensions[node_name]
-                # Include shadow in width calculation
-                box_width = dims.width + (1 if self.shadow else 0)
-                max_width = max(max_width, box_width)
-                # Include shadow in height calculation
-                box_height = dims.height + (2 if self.shadow else 0)
-                heights.append(box_height)
-
-            layer_widths.append(max_width)
-            layer_heights.append(heights)
+        layers = layout_result.layers
+        spacing = self.vertical_spacing
+
+        # Calculate dimensions for each layer (now columns), including shadows
+        shadow_width = 1 if self.shadow else 0
+        shadow_height = 2 if self.shadow else 0
+        layer_widths = [
+            max((box_dimensions[n].width + shadow_width for n in layer), default=0)
+            for layer in layers
+        ]
+        layer_heights = [
+            [box_dimensions[n].height + shadow_height for n in layer]
+            for layer in layers
+        ]
 
         # Calculate cumulative x positions (left edge of each layer/column)
-        x_positions: List[int] = [0]
-        for width in layer_widths[:-1]:
-            x_positions.append(x_positions[-1] + width + self.horizontal_spacing)
+        x_positions = list(
+            accumulate(
+                (width + self.horizontal_spacing for width in layer_widths[:-1]),
+                initial=0,
+            )
+        )
 
         # Calculate total height of each layer (column)
-        layer_total_heights = []
-        for heights in layer_heights:
-            if heights:
-                total = sum(heights) + self.vertical_spacing * (len(heights) - 1)
-            else:
-                total = 0
-            layer_total_heights.append(total)
+        layer_total_heights = [
+            sum(heights) + spacing * (len(heights) - 1) if heights else 0
+            for heights in layer_heights
+        ]
 
         # Find maximum layer height for centering
-        max_layer_height = max(layer_total_heights) if layer_total_heights else 0
+        max_layer_height = max(layer_total_heights, default=0)
 
         # Assign x,y positions
-        for layer_idx, layer in enumerate(layout_result.layers):
-            heights = layer_heights[layer_idx]
-            total_height = layer_total_heights[layer_idx]
-
+        for layer, heights, total_height, x in zip(
+            layers, layer_heights, layer_total_heights, x_positions
+        ):
             # Center this layer vertically, plus top margin for back edges
             start_y = top_margin + (max_layer_height - total_height) // 2
-
-            current_y = start_y
-            for pos_idx, node_name in enumerate(layer):
-                positions[node_name] = (x_positions[layer_idx], current_y)
-                current_y += heights[pos_idx] + self.vertical_spacing
+            y_positions = accumulate(
+                (height + spacing for height in heights[:-1]), initial=start_y
+            )
+            for node_name, y in zip(layer, y_positions):
+                positions[node_name] = (x, y)
 
         return positions
 
@@ -368,6 +379,7 @@ class PositionCalculator:
         self,
         box_dimensions: Dict[str, BoxDimensions],
         box_positions: Dict[str, Tuple[int, int]],
+        group_boundaries: Optional[List[GroupBoundary]] = None,
     ) -> Tuple[int, int]:
         """
         Calculate required canvas dimensions.
@@ -375,21 +387,36 @@ class PositionCalculator:
         Args:
             box_dimensions: Dictionary of box dimensions.
             box_positions: Dictionary of box positions.
+            group_boundaries: Optional group boxes, which may extend beyond
+                the nodes they contain.
 
         Returns:
             Tuple of (width, height) for the canvas.
         """
+        if not box_positions and not group_boundaries:
+            return 0, 0
+
+        shadow_pad = 2 if self.shadow else 0
         max_x = 0
         max_y = 0
-
         for node_name, (x, y) in box_positions.items():
             dims = box_dimensions[node_name]
-            right = x + dims.width + (2 if self.shadow else 0)
-            bottom = y + dims.height + (2 if self.shadow else 0)
-            max_x = max(max_x, right)
-            max_y = max(max_y, bottom)
-
-        return max_x, max_y
+            right = x + dims.width
+            bottom = y + dims.height
+            if right > max_x:
+                max_x = right
+            if bottom > max_y:
+                max_y = bottom
+
+        for gb in group_boundaries or ():
+            right = gb.x + gb.width
+            bottom = gb.y + gb.height
+            if right > max_x:
+                max_x = right
+            if bottom > max_y:
+                max_y = bottom
+
+        return max_x + shadow_pad, max_y + shadow_pad
 
     def calculate_port_x(
         self, box_x: int, box_width: int, port_idx: int, port_count: int
@@ -543,6 +570,34 @@ class PositionCalculator:
 
         return boundaries
 
+    def offset_group_boundaries(
+        self, group_boundaries: List[GroupBoundary], dx: int, dy: int
+    ) -> List[GroupBoundary]:
+        """
+        Translate group boundaries by a constant offset.
+
+        Equivalent to recalculating the boundaries after moving every box by
+        the same offset, without re-measuring the member boxes.
+
+        Args:
+            group_boundaries: Group boundaries to translate.
+            dx: Horizontal offset.
+            dy: Vertical offset.
+
+        Returns:
+            List of translated GroupBoundary objects.
+        """
+        return [
+            replace(
+                gb,
+                x=gb.x + dx,
+                y=gb.y + dy,
+                title_x=gb.title_x + dx,
+                title_y=gb.title_y + dy,
+            )
+            for gb in group_boundaries
+        ]
+
     def resolve_group_overlaps(
         self,
         group_boundaries: List[GroupBoundary],
@@ -5,8 +5,11 @@ Handles drawing boxes with shadows, text wrapping, and line art
 using Unicode box-drawing characters.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Union
+
+from .models import DATACLASS_SLOTS
 
 # Unicode box-drawing characters
 BOX_CHARS = {
@@ -75,7 +78,7 @@ DASHED_BOX_CHARS = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BoxDimensions:
     """Dimensions of a rendered box."""
 
@@ -85,18 +88,94 @@ class BoxDimensions:
     padding: int = 1  # Internal padding
 
 
+class CanvasRow(Sequence):
+    """
+    A live view of one canvas row, as returned by ``Canvas.grid``.
+
+    Indexing reads from and writes to the canvas cells, so
+    ``canvas.grid[y][x] = char`` and slice assignment behave as they did when
+    rows were lists, except that a row cannot change length.
+    """
+
+    def __init__(self, cells: List[str], start: int, width: int):
+        self._cells = cells
+        self._start = start
+        self._width = width
+
+    def _index(self, x: int) -> int:
+        if x < 0:
+            x += self._width
+        if not 0 <= x < self._width:
+            raise IndexError("canvas row index out of range")
+        return self._start + x
+
+    def __len__(self) -> int:
+        return self._width
+
+    def __getitem__(self, x: Union[int, slice]):
+        if isinstance(x, slice):
+            return self._cells[self._start : self._start + self._width][x]
+        return self._cells[self._index(x)]
+
+    def __setitem__(self, x: Union[int, slice], char) -> None:
+        if isinstance(x, slice):
+            indices = range(self._start, self._start + self._width)[x]
+            chars = list(char)
+            if len(chars) != len(indices):
+                raise ValueError("canvas rows cannot change length")
+            for index, new_char in zip(indices, chars):
+                self._cells[index] = new_char
+            return
+        self._cells[self._index(x)] = char
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CanvasRow, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Canvas:
     """
     A 2D character canvas for drawing ASCII art.
+
+    Cells are stored row-major in a single flat list, so a row span is a
+    contiguous slice and a column span is a slice with step ``width``.
+    The ``grid`` property still offers the row-of-rows view.
     """
 
     def __init__(self, width: int, height: int, fill_char: str = " "):
         self.width = width
         self.height = height
-        self.grid: List[List[str]] = [
-            [fill_char for _ in range(width)] for _ in range(height)
+        self.cells: List[str] = [fill_char] * (width * height)
+        self._rows = self._make_rows()
+
+    def _make_rows(self) -> List[CanvasRow]:
+        """Build one row view onto cells per canvas row."""
+        return [
+            CanvasRow(self.cells, y * self.width, self.width)
+            for y in range(self.height)
         ]
 
+    @property
+    def grid(self) -> List[CanvasRow]:
+        """
+        Rows of the canvas, indexed as ``grid[y][x]``.
+
+        Each row is a view onto ``cells``, so reads and writes through it
+        go straight to the canvas. The views are built once per canvas.
+        """
+        return self._rows
+
+    @grid.setter
+    def grid(self, rows: List[List[str]]) -> None:
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.cells = [char for row in rows for char in row]
+        self._rows = self._make_rows()
+
     def set(self, x: int, y: int, char: str, reason: str = "") -> None:
         """
         Set a character at position (x, y).
@@ -109,25 +188,187 @@ class Canvas:
                     ignored by regular Canvas)
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.grid[y][x] = char
+            self.cells[y * self.width + x] = char
 
     def get(self, x: int, y: int) -> str:
         """Get character at position (x, y)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[y][x]
+            return self.cells[y * self.width + x]
         return " "
 
+    def _row_slice(self, x_start: int, x_end: int, y: int) -> Optional[slice]:
+        """Slice of cells for columns x_start..x_end-1 of row y, or None."""
+        if not 0 <= y < self.height:
+            return None
+        x_start = max(x_start, 0)
+        x_end = min(x_end, self.width)
+        if x_start >= x_end:
+            return None
+        row = y * self.width
+        return slice(row + x_start, row + x_end)
+
+    def _column_slice(self, x: int, y_start: int, y_end: int) -> Optional[slice]:
+        """Slice of cells for rows y_start..y_end-1 of column x, or None."""
+        if not 0 <= x < self.width:
+            return None
+        y_start = max(y_start, 0)
+        y_end = min(y_end, self.height)
+        if y_start >= y_end:
+            return None
+        return slice(y_start * self.width + x, y_end * self.width + x, self.width)
+
+    def get_hspan(self, x_start: int, x_end: int, y: int) -> List[str]:
+        """Get the characters in columns x_start..x_end-1 of row y (clipped)."""
+        span = self._row_slice(x_start, x_end, y)
+        return self.cells[span] if span else []
+
+    def get_vspan(self, x: int, y_start: int, y_end: int) -> List[str]:
+        """Get the characters in rows y_start..y_end-1 of column x (clipped)."""
+        span = self._column_slice(x, y_start, y_end)
+        return self.cells[span] if span else []
+
+    def hline(
+        self, x_start: int, x_end: int, y: int, char: str, reason: str = ""
+    ) -> None:
+        """
+        Fill columns x_start..x_end-1 of row y with a character.
+
+        Equivalent to calling set() for each cell, but done as a single slice
+        assignment. Cells outside the canvas are ignored.
+
+        Args:
+            x_start: First X coordinate (inclusive)
+            x_end: Last X coordinate (exclusive)
+            y: Y coordinate
+            char: Character to place
+            reason: Optional reason for placement (used by TracedCanvas for debugging,
+                    ignored by regular Canvas)
+        """
+        span = self._row_slice(x_start, x_end, y)
+        if span:
+            self.cells[span] = [char] * (span.stop - span.start)
+
+    def vline(
+        self, x: int, y_start: int, y_end: int, char: str, reason: str = ""
+    ) -> None:
+        """
+        Fill rows y_start..y_end-1 of column x with a character.
+
+        Equivalent to calling set() for each cell, but done as a single strided
+        slice assignment. Cells outside the canvas are ignored.
+
+        Args:
+            x: X coordinate
+            y_start: First Y coordinate (inclusive)
+            y_end: Last Y coordinate (exclusive)
+            char: Character to place
+            reason: Optional reason for placement (used by TracedCanvas for debugging,
+                    ignored by regular Canvas)
+        """
+        span = self._column_slice(x, y_start, y_end)
+        if span:
+            # Count the strided span without copying it
+            count = len(range(span.start, span.stop, span.step))
+            self.cells[span] = [char] * count
+
+    def merge_cell(
+        self,
+        x: int,
+        y: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Merge a character into the cell at (x, y).
+
+        If the current character is a key of ``merge`` it is replaced by the
+        mapped character; otherwise the cell is left untouched. Positions
+        outside the canvas are ignored.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            merge: Maps a current character to its replacement
+            reasons: Optional placement reason per current character (used by
+                     TracedCanvas for debugging, ignored by regular Canvas)
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = y * self.width + x
+            current = self.cells[index]
+            self.cells[index] = merge.get(current, current)
+
+    def merge_hline(
+        self,
+        x_start: int,
+        x_end: int,
+        y: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Merge a line into columns x_start..x_end-1 of row y.
+
+        Each cell whose current character is a key of ``merge`` is replaced by
+        the mapped character; other cells are left untouched. Cells outside
+        the canvas are ignored.
+
+        Args:
+            x_start: First X coordinate (inclusive)
+            x_end: Last X coordinate (exclusive)
+            y: Y coordinate
+            merge: Maps a current character to its replacement
+            reasons: Optional placement reason per current character (used by
+                     TracedCanvas for debugging, ignored by regular Canvas)
+        """
+        span = self._row_slice(x_start, x_end, y)
+        if span:
+            segment = self.cells[span]
+            # merge.get(c, c) for every cell, looped in C by map()
+            self.cells[span] = list(map(merge.get, segment, segment))
+
+    def merge_vline(
+        self,
+        x: int,
+        y_start: int,
+        y_end: int,
+        merge: Dict[str, str],
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Merge a line into rows y_start..y_end-1 of column x.
+
+        Works like merge_hline() on a column span.
+
+        Args:
+            x: X coordinate
+            y_start: First Y coordinate (inclusive)
+            y_end: Last Y coordinate (exclusive)
+            merge: Maps a current character to its replacement
+            reasons: Optional placement reason per current character (used by
+                     TracedCanvas for debugging, ignored by regular Canvas)
+        """
+        span = self._column_slice(x, y_start, y_end)
+        if span:
+            segment = self.cells[span]
+            self.cells[span] = list(map(merge.get, segment, segment))
+
     def draw_text(self, x: int, y: int, text: str) -> None:
         """Draw text starting at position (x, y)."""
-        for i, char in enumerate(text):
-            self.set(x + i, y, char)
+        span = self._row_slice(x, x + len(text), y)
+        if span:
+            # Skip any characters clipped off the left edge
+            offset = span.start - y * self.width - x
+            self.cells[span] = text[offset : offset + span.stop - span.start]
 
     def render(self) -> str:
         """Render the canvas to a string."""
-        lines = []
-        for row in self.grid:
-            line = "".join(row).rstrip()
-            lines.append(line)
+        # Join every cell once, then cut the rows out of the resulting string
+        text = "".join(self.cells)
+        width = self.width
+        lines = [
+            text[start : start + width].rstrip()
+            for start in range(0, len(text), width or 1)
+        ]
 
         # Remove trailing empty lines
         while lines and not lines[-1]:
@@ -219,36 +460,36 @@ class BoxRenderer:
         w = dimensions.width
         h = dimensions.height
         chars = self.box_chars
+        horizontal = chars["horizontal"]
+        vertical = chars["vertical"]
+        shadow = chars["shadow"]
 
         # Draw top border (no shadow on top row)
         canvas.set(x, y, chars["top_left"])
-        for i in range(1, w - 1):
-            canvas.set(x + i, y, chars["horizontal"])
+        canvas.hline(x + 1, x + w - 1, y, horizontal)
         canvas.set(x + w - 1, y, chars["top_right"])
 
         # Draw sides and content
         for row in range(1, h - 1):
-            canvas.set(x, y + row, chars["vertical"])
-            canvas.set(x + w - 1, y + row, chars["vertical"])
+            canvas.set(x, y + row, vertical)
+            canvas.set(x + w - 1, y + row, vertical)
 
             # Draw shadow on right side (content rows only)
             if self.shadow:
-                canvas.set(x + w, y + row, chars["shadow"])
+                canvas.set(x + w, y + row, shadow)
 
         # Draw bottom border
         canvas.set(x, y + h - 1, chars["bottom_left"])
-        for i in range(1, w - 1):
-            canvas.set(x + i, y + h - 1, chars["horizontal"])
+        canvas.hline(x + 1, x + w - 1, y + h - 1, horizontal)
         canvas.set(x + w - 1, y + h - 1, chars["bottom_right"])
 
         # Draw shadow on right side of bottom border
         if self.shadow:
-            canvas.set(x + w, y + h - 1, chars["shadow"])
+            canvas.set(x + w, y + h - 1, shadow)
 
         # Draw bottom shadow (offset by 1 to align under content, not under left border)
         if self.shadow:
-            for i in range(1, w + 1):
-                canvas.set(x + i, y + h, chars["shadow"])
+            canvas.hline(x + 1, x + w + 1, y + h, shadow)
 
         # Draw text (centered)
         # Compact mode: text starts at row 1 (right after top border)
@@ -282,22 +523,32 @@ class LineRenderer:
         else:
             direction = "down"
 
+        # Bind the characters once rather than indexing the tables per cell
+        vertical = LINE_CHARS["vertical"]
+        horizontal = LINE_CHARS["horizontal"]
+        cross = LINE_CHARS["cross"]
+        tee_right = LINE_CHARS["tee_right"]
+        tee_left = LINE_CHARS["tee_left"]
+        left_corners = (LINE_CHARS["corner_top_left"], LINE_CHARS["corner_bottom_left"])
+        right_corners = (
+            LINE_CHARS["corner_top_right"],
+            LINE_CHARS["corner_bottom_right"],
+        )
+        arrows = (ARROW_CHARS["down"], ARROW_CHARS["up"])
+        fillable = (" ", vertical, BOX_CHARS["shadow"])
+
         for y in range(y_start, y_end):
             current = canvas.get(x, y)
-            if current == LINE_CHARS["horizontal"]:
-                canvas.set(x, y, LINE_CHARS["cross"])
-            elif current == LINE_CHARS["corner_top_left"]:
-                canvas.set(x, y, LINE_CHARS["tee_right"])
-            elif current == LINE_CHARS["corner_top_right"]:
-                canvas.set(x, y, LINE_CHARS["tee_left"])
-            elif current == LINE_CHARS["corner_bottom_left"]:
-                canvas.set(x, y, LINE_CHARS["tee_right"])
-            elif current == LINE_CHARS["corner_bottom_right"]:
-                canvas.set(x, y, LINE_CHARS["tee_left"])
-            elif current in (ARROW_CHARS["down"], ARROW_CHARS["up"]):
+            if current == horizontal:
+                canvas.set(x, y, cross)
+            elif current in left_corners:
+                canvas.set(x, y, tee_right)
+            elif current in right_corners:
+                canvas.set(x, y, tee_left)
+            elif current in arrows:
                 pass  # Don't overwrite arrows
-            elif current in (" ", LINE_CHARS["vertical"], BOX_CHARS["shadow"]):
-                canvas.set(x, y, LINE_CHARS["vertical"])
+            elif current in fillable:
+                canvas.set(x, y, vertical)
 
         # Draw arrow at end
         if arrow_at_end:
@@ -319,22 +570,32 @@ class LineRenderer:
         else:
             direction = "right"
 
+        # Bind the characters once rather than indexing the tables per cell
+        vertical = LINE_CHARS["vertical"]
+        horizontal = LINE_CHARS["horizontal"]
+        cross = LINE_CHARS["cross"]
+        tee_down = LINE_CHARS["tee_down"]
+        tee_up = LINE_CHARS["tee_up"]
+        top_corners = (LINE_CHARS["corner_top_left"], LINE_CHARS["corner_top_right"])
+        bottom_corners = (
+            LINE_CHARS["corner_bottom_left"],
+            LINE_CHARS["corner_bottom_right"],
+        )
+        arrows = (ARROW_CHARS["left"], ARROW_CHARS["right"])
+        fillable = (" ", horizontal, BOX_CHARS["shadow"])
+
         for x in range(x_start, x_end):
             current = canvas.get(x, y)
-            if current == LINE_CHARS["vertical"]:
-                canvas.set(x, y, LINE_CHARS["cross"])
-            elif current == LINE_CHARS["corner_top_left"]:
-                canvas.set(x, y, LINE_CHARS["tee_down"])
-            elif current == LINE_CHARS["corner_top_right"]:
-                canvas.set(x, y, LINE_CHARS["tee_down"])
-            elif current == LINE_CHARS["corner_bottom_left"]:
-                canvas.set(x, y, LINE_CHARS["tee_up"])
-            elif current == LINE_CHARS["corner_bottom_right"]:
-                canvas.set(x, y, LINE_CHARS["tee_up"])
-            elif current in (ARROW_CHARS["left"], ARROW_CHARS["right"]):
+            if current == vertical:
+                canvas.set(x, y, cross)
+            elif current in top_corners:
+                canvas.set(x, y, tee_down)
+            elif current in bottom_corners:
+                canvas.set(x, y, tee_up)
+            elif current in arrows:
                 pass  # Don't overwrite arrows
-            elif current in (" ", LINE_CHARS["horizontal"], BOX_CHARS["shadow"]):
-                canvas.set(x, y, LINE_CHARS["horizontal"])
+            elif current in fillable:
+                canvas.set(x, y, horizontal)
 
         # Draw arrow at end
         if arrow_at_end:
@@ -482,8 +743,7 @@ class TitleRenderer:
 
         # Draw top border
         canvas.set(x, y, chars["top_left"])
-        for i in range(1, actual_width - 1):
-            canvas.set(x + i, y, chars["horizontal"])
+        canvas.hline(x + 1, x + actual_width - 1, y, chars["horizontal"])
         canvas.set(x + actual_width - 1, y, chars["top_right"])
 
         # Draw middle rows with title text (centered)
@@ -499,8 +759,7 @@ class TitleRenderer:
 
         # Draw bottom border
         canvas.set(x, y + height - 1, chars["bottom_left"])
-        for i in range(1, actual_width - 1):
-            canvas.set(x + i, y + height - 1, chars["horizontal"])
+        canvas.hline(x + 1, x + actual_width - 1, y + height - 1, chars["horizontal"])
         canvas.set(x + actual_width - 1, y + height - 1, chars["bottom_right"])
 
         return height  # Height of the title box
@@ -562,32 +821,33 @@ class GroupBoxRenderer:
             title_start = x + (width - len(title)) // 2
             canvas.draw_text(title_start, title_row, title)
 
+        horizontal = chars["horizontal"]
+        vertical = chars["vertical"]
+        shadow = chars["shadow"]
+
         # Draw top border (solid corners, dashed line)
         canvas.set(x, box_top, chars["top_left"])
-        for i in range(1, width - 1):
-            canvas.set(x + i, box_top, chars["horizontal"])
+        canvas.hline(x + 1, x + width - 1, box_top, horizontal)
         canvas.set(x + width - 1, box_top, chars["top_right"])
 
         # Draw sides (dashed vertical lines)
         for row in range(1, box_height - 1):
-            canvas.set(x, box_top + row, chars["vertical"])
-            canvas.set(x + width - 1, box_top + row, chars["vertical"])
+            canvas.set(x, box_top + row, vertical)
+            canvas.set(x + width - 1, box_top + row, vertical)
 
             # Draw shadow on right side
             if self.shadow:
-                canvas.set(x + width, box_top + row, chars["shadow"])
+                canvas.set(x + width, box_top + row, shadow)
 
         # Draw bottom border (solid corners, dashed line)
         canvas.set(x, box_top + box_height - 1, chars["bottom_left"])
-        for i in range(1, width - 1):
-            canvas.set(x + i, box_top + box_height - 1, chars["horizontal"])
+        canvas.hline(x + 1, x + width - 1, box_top + box_height - 1, horizontal)
         canvas.set(x + width - 1, box_top + box_height - 1, chars["bottom_right"])
 
         # Draw shadow on right side of bottom border
         if self.shadow:
-            canvas.set(x + width, box_top + box_height - 1, chars["shadow"])
+            canvas.set(x + width, box_top + box_height - 1, shadow)
 
         # Draw bottom shadow
         if self.shadow:
-            for i in range(1, width + 1):
-                canvas.set(x + i, box_top + box_height, chars["shadow"])
+            canvas.hline(x + 1, x + width + 1, box_top + box_height, shadow)
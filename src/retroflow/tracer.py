@@ -27,8 +27,10 @@ The trace captures:
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from .models import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CharacterPlacement:
     """
     Record of a single character placement on the canvas.
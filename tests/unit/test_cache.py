@@ -0,0 +1,46 @@
+"""Unit tests for the cache module."""
+
+from retroflow.cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_get_missing_returns_none(self):
+        """Test that looking up an unknown key returns None."""
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_put_and_get(self):
+        """Test that stored values can be read back."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert list(cache) == ["a", "c"]
+
+    def test_put_existing_key_refreshes_it(self):
+        """Test that overwriting an entry marks it as recently used."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 10)
+        cache.put("c", 3)
+        assert cache.get("a") == 10
+        assert "b" not in cache
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.clear()
+        assert len(cache) == 0
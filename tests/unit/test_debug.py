@@ -74,6 +74,58 @@ class TestTracedCanvas:
         assert traced.get(5, 5) == "Z"
         assert traced.get(0, 0) == " "
 
+    def test_hline_records_each_cell(self):
+        """Test that hline() records one placement per cell."""
+        canvas = Canvas(20, 10)
+        trace = RenderTrace()
+        traced = TracedCanvas(canvas, trace)
+
+        traced.hline(2, 5, 1, "─", reason="horizontal_line")
+
+        assert [(p.x, p.y) for p in trace.character_placements] == [
+            (2, 1),
+            (3, 1),
+            (4, 1),
+        ]
+        assert all(p.reason == "horizontal_line" for p in trace.character_placements)
+        assert traced.get_hspan(2, 5, 1) == ["─", "─", "─"]
+
+    def test_merge_vline_records_changed_cells(self):
+        """Test that merge_vline() records only the cells it changes."""
+        canvas = Canvas(20, 10)
+        trace = RenderTrace()
+        traced = TracedCanvas(canvas, trace)
+        canvas.set(3, 2, "─")
+        canvas.set(3, 3, "▼")
+
+        traced.merge_vline(
+            3, 1, 4, {" ": "│", "─": "┼"}, {" ": "vertical_line", "─": "cross"}
+        )
+
+        assert [(p.y, p.char, p.reason) for p in trace.character_placements] == [
+            (1, "│", "vertical_line"),
+            (2, "┼", "cross"),
+        ]
+        assert traced.get_vspan(3, 1, 4) == ["│", "┼", "▼"]
+        traced.vline(4, 0, 2, "│")
+        traced.merge_hline(0, 2, 0, {" ": "─"})
+        assert len(trace.character_placements) == 6
+        assert trace.character_placements[-1].reason == "horizontal_line"
+
+    def test_merge_cell_records_changed_cell(self):
+        """Test that merge_cell() records the cell only when it changes."""
+        canvas = Canvas(20, 10)
+        trace = RenderTrace()
+        traced = TracedCanvas(canvas, trace)
+        canvas.set(3, 2, "│")
+
+        traced.merge_cell(3, 2, {"│": "├"}, {"│": "tee"})
+        traced.merge_cell(4, 2, {"│": "├"})
+
+        assert [(p.x, p.char, p.reason) for p in trace.character_placements] == [
+            (3, "├", "tee"),
+        ]
+
     def test_draw_text_records_placements(self):
         """Test that draw_text records each character."""
         canvas = Canvas(20, 10)
@@ -428,6 +480,27 @@ class TestDebugIntegration:
         chars = [p.char for p in trace.character_placements]
         assert any(c in "│─┌┐└┘" for c in chars)
 
+    def test_stage_only_debug_skips_character_tracing(self):
+        """Test that debug="stages" records stages but no placements."""
+        from retroflow import FlowchartGenerator
+
+        gen = FlowchartGenerator()
+        result = gen.generate("A -> B\nB -> A", debug="stages")
+
+        trace = gen.get_trace()
+        assert result == FlowchartGenerator().generate("A -> B\nB -> A")
+        assert trace.character_placements == []
+        assert trace.get_stage("back_edges_drawn") is not None
+
+    def test_other_truthy_debug_values_trace_everything(self):
+        """Test that truthy debug values other than "stages" trace characters."""
+        from retroflow import FlowchartGenerator
+
+        gen = FlowchartGenerator()
+        for debug in (1, "yes", "chars"):
+            gen.generate("A -> B", debug=debug)
+            assert gen.get_trace().character_placements
+
     def test_canvas_inspector_on_generated_flowchart(self):
         """Test CanvasInspector on a generated flowchart."""
         from retroflow import FlowchartGenerator
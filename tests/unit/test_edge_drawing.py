@@ -5,7 +5,13 @@ import pytest
 from retroflow import FlowchartGenerator
 from retroflow.edge_drawing import EdgeDrawer
 from retroflow.positioning import PositionCalculator
-from retroflow.renderer import BoxRenderer
+from retroflow.renderer import (
+    BOX_CHARS,
+    LINE_CHARS,
+    BoxDimensions,
+    BoxRenderer,
+    Canvas,
+)
 
 
 @pytest.fixture
@@ -65,6 +71,96 @@ class TestEdgeDrawerInit:
         assert drawer.shadow is False
 
 
+class TestLinePrimitives:
+    """Tests for the EdgeDrawer line drawing primitives."""
+
+    def test_horizontal_line_on_clear_row(self, edge_drawer):
+        """Test a horizontal line over empty cells fills the whole span."""
+        canvas = Canvas(20, 5)
+        edge_drawer._set_box_regions({}, {})
+        edge_drawer._draw_horizontal_line(canvas, 2, 10, 1)
+
+        assert canvas.get(2, 1) == " "
+        assert all(canvas.get(x, 1) == LINE_CHARS["horizontal"] for x in range(3, 10))
+        assert canvas.get(10, 1) == " "
+
+    def test_horizontal_line_merges_and_skips_boxes(self, edge_drawer):
+        """Test a horizontal line merges junctions and leaves box borders alone."""
+        canvas = Canvas(20, 5)
+        dims = BoxDimensions(width=5, height=3, text_lines=["X"])
+        edge_drawer._set_box_regions({"X": (10, 0)}, {"X": dims})
+        canvas.set(4, 1, LINE_CHARS["vertical"])
+        canvas.set(10, 1, BOX_CHARS["vertical"])
+
+        edge_drawer._draw_horizontal_line(canvas, 0, 18, 1)
+
+        assert canvas.get(4, 1) == LINE_CHARS["cross"]
+        assert canvas.get(10, 1) == BOX_CHARS["vertical"]
+        assert canvas.get(12, 1) == " "
+        assert canvas.get(16, 1) == LINE_CHARS["horizontal"]
+
+    def test_vertical_line_merges_and_skips_boxes(self, edge_drawer):
+        """Test a vertical line merges junctions and leaves box borders alone."""
+        canvas = Canvas(10, 20)
+        dims = BoxDimensions(width=5, height=3, text_lines=["X"])
+        edge_drawer._set_box_regions({"X": (2, 10)}, {"X": dims})
+        canvas.set(4, 3, LINE_CHARS["horizontal"])
+        canvas.set(4, 5, LINE_CHARS["corner_top_right"])
+        canvas.set(4, 10, BOX_CHARS["horizontal"])
+
+        edge_drawer._draw_vertical_line(canvas, 4, 18, 0)
+
+        assert canvas.get(4, 0) == LINE_CHARS["vertical"]
+        assert canvas.get(4, 3) == LINE_CHARS["cross"]
+        assert canvas.get(4, 5) == LINE_CHARS["tee_left"]
+        assert canvas.get(4, 10) == BOX_CHARS["horizontal"]
+        assert canvas.get(4, 11) == " "
+        assert canvas.get(4, 18) == LINE_CHARS["vertical"]
+
+
+class TestPortIndices:
+    """Tests for port slot lookup."""
+
+    def test_port_indices_match_sorted_order(self, edge_drawer):
+        """Test each edge maps to its position in the sorted port lists."""
+        edges_from = {"A": ["B", "C"], "D": ["C"]}
+        edges_to = {"B": ["A"], "C": ["D", "A"]}
+
+        assert edge_drawer._port_indices(edges_from, edges_to) == {
+            ("A", "B"): (0, 0),
+            ("A", "C"): (1, 1),
+            ("D", "C"): (0, 0),
+        }
+
+
+class TestFanoutTargets:
+    """Tests for fan-out target detection."""
+
+    def test_fanout_targets_tb(self, edge_drawer):
+        """Test only targets without column overlap need fan-out in TB mode."""
+        dims = BoxDimensions(width=10, height=3, text_lines=["x"])
+        positions = {"A": (0, 0), "B": (2, 10), "C": (30, 10), "D": (0, 20)}
+        edges_from = {"A": ["B", "C"], "B": ["D"]}
+
+        fanout = edge_drawer._fanout_targets(
+            edges_from, positions, dict.fromkeys(positions, dims), horizontal=False
+        )
+
+        assert fanout == {"A": {"C"}, "B": set()}
+
+    def test_fanout_targets_lr(self, edge_drawer):
+        """Test only targets without row overlap need fan-out in LR mode."""
+        dims = BoxDimensions(width=10, height=3, text_lines=["x"])
+        positions = {"A": (0, 0), "B": (20, 0), "C": (20, 10)}
+        edges_from = {"A": ["B", "C"]}
+
+        fanout = edge_drawer._fanout_targets(
+            edges_from, positions, dict.fromkeys(positions, dims), horizontal=True
+        )
+
+        assert fanout == {"A": {"C"}}
+
+
 class TestEdgeDrawingIntegration:
     """Integration tests for edge drawing with various scenarios."""
 
@@ -4,13 +4,15 @@ import os
 import tempfile
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 
+from retroflow.export import FlowchartExporter
 from retroflow.generator import FlowchartGenerator
 from retroflow.renderer import (
     ARROW_CHARS,
     BOX_CHARS,
     BOX_CHARS_DOUBLE,
+    BOX_CHARS_ROUNDED,
     DASHED_BOX_CHARS,
 )
 
@@ -72,6 +74,13 @@ class TestFlowchartGeneratorInit:
         gen = FlowchartGenerator(font="Cascadia Code")
         assert gen.font == "Cascadia Code"
 
+    def test_exporter_created_on_first_use(self):
+        """Test that the exporter is only built when first accessed."""
+        gen = FlowchartGenerator(font="Cascadia Code")
+        assert "exporter" not in vars(gen)
+        assert gen.exporter.default_font == "Cascadia Code"
+        assert gen.exporter is gen.exporter
+
     def test_all_custom_parameters(self):
         """Test FlowchartGenerator with all custom parameters."""
         gen = FlowchartGenerator(
@@ -244,6 +253,157 @@ class TestFlowchartGeneratorGenerate:
             assert f"N{i}" in result
 
 
+class TestFlowchartGeneratorRenderCache:
+    """Tests for caching of rendered flowcharts."""
+
+    def test_repeat_generate_returns_cached_result(self, generator, simple_input):
+        """Test that repeating a call returns the same flowchart."""
+        first = generator.generate(simple_input)
+        second = generator.generate(simple_input)
+        assert second == first
+        assert len(generator._render_cache) == 1
+
+    def test_title_is_part_of_cache_key(self, generator, simple_input):
+        """Test that a different title renders a different flowchart."""
+        plain = generator.generate(simple_input)
+        titled = generator.generate(simple_input, title="Pipeline")
+        assert "Pipeline" in titled
+        assert "Pipeline" not in plain
+        assert generator.generate(simple_input) == plain
+
+    def test_settings_are_part_of_cache_key(self, generator, simple_input):
+        """Test that changing a component setting re-renders the flowchart."""
+        narrow = generator.generate(simple_input)
+        generator.position_calculator.min_box_width = 30
+        wide = generator.generate(simple_input)
+        assert wide != narrow
+        assert len(generator._render_cache) == 2
+
+    GROUPED_INPUT = (
+        "[Team: Load Data Clean Data]\n"
+        "Load Data -> Clean Data\n"
+        "Clean Data -> Train Model\n"
+        "Train Model -> Load Data"
+    )
+    LONG_TITLE = "A rather long title for the chart"
+
+    def _assert_change_rerenders(self, change):
+        """Assert a component change misses the cache and matches a fresh render."""
+        generator = FlowchartGenerator(title=self.LONG_TITLE)
+        before = generator.generate(self.GROUPED_INPUT)
+        change(generator)
+        after = generator.generate(self.GROUPED_INPUT)
+
+        fresh = FlowchartGenerator(title=self.LONG_TITLE)
+        change(fresh)
+        expected = fresh.generate(self.GROUPED_INPUT)
+
+        assert expected != before
+        assert after == expected
+
+    def test_box_chars_are_part_of_cache_key(self):
+        """Test that switching to rounded corners re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.box_renderer, "box_chars", BOX_CHARS_ROUNDED)
+        )
+
+    def test_box_chars_edited_in_place_are_part_of_cache_key(self):
+        """Test that editing the box character set in place re-renders."""
+        generator = FlowchartGenerator()
+        generator.box_renderer.box_chars = dict(BOX_CHARS)
+        before = generator.generate(self.GROUPED_INPUT)
+        generator.box_renderer.box_chars["top_left"] = "╭"
+        after = generator.generate(self.GROUPED_INPUT)
+        assert "╭" in after
+        assert "╭" not in before
+
+    def test_box_shadow_is_part_of_cache_key(self):
+        """Test that turning off the box shadow re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.box_renderer, "shadow", False)
+        )
+
+    def test_box_padding_is_part_of_cache_key(self):
+        """Test that changing the box padding re-renders."""
+        self._assert_change_rerenders(lambda g: setattr(g.box_renderer, "padding", 3))
+
+    def test_box_compact_is_part_of_cache_key(self):
+        """Test that switching off compact boxes re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.box_renderer, "compact", False)
+        )
+
+    def test_max_text_width_is_part_of_cache_key(self):
+        """Test that changing the text wrap width re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.box_renderer, "max_text_width", 3)
+        )
+
+    def test_group_box_shadow_is_part_of_cache_key(self):
+        """Test that turning off the group box shadow re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.group_box_renderer, "shadow", False)
+        )
+
+    def test_group_box_chars_are_part_of_cache_key(self):
+        """Test that changing the group box characters re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(
+                g.group_box_renderer,
+                "chars",
+                {**g.group_box_renderer.chars, "top_left": "+"},
+            )
+        )
+
+    def test_title_padding_is_part_of_cache_key(self):
+        """Test that changing the title padding re-renders."""
+        self._assert_change_rerenders(lambda g: setattr(g.title_renderer, "padding", 5))
+
+    def test_title_line_width_is_part_of_cache_key(self):
+        """Test that changing the title wrap width re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.title_renderer, "max_line_width", 40)
+        )
+
+    def test_title_box_chars_are_part_of_cache_key(self):
+        """Test that changing the title box characters re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(
+                g.title_renderer,
+                "box_chars",
+                {**g.title_renderer.box_chars, "top_left": "+"},
+            )
+        )
+
+    def test_position_shadow_is_part_of_cache_key(self):
+        """Test that the position calculator's shadow setting re-renders."""
+        self._assert_change_rerenders(
+            lambda g: setattr(g.position_calculator, "shadow", False)
+        )
+
+    def test_edge_shadow_is_part_of_cache_key(self):
+        """Test that the edge drawer's shadow setting re-renders."""
+        self._assert_change_rerenders(lambda g: setattr(g.edge_drawer, "shadow", False))
+
+    def test_debug_bypasses_cache(self, generator, simple_input):
+        """Test that debug runs still capture a trace for cached input."""
+        result = generator.generate(simple_input)
+        traced = generator.generate(simple_input, debug=True)
+        assert traced == result
+        assert generator.get_trace() is not None
+        generator.generate(simple_input)
+        assert generator.get_trace() is None
+
+    def test_cache_is_bounded(self, generator):
+        """Test that the cache evicts the least recently used entries."""
+        from retroflow.generator import RENDER_CACHE_SIZE
+
+        for i in range(RENDER_CACHE_SIZE + 5):
+            generator.generate(f"A{i} -> B{i}")
+        assert len(generator._render_cache) == RENDER_CACHE_SIZE
+        assert all(key[0] != "A0 -> B0" for key in generator._render_cache)
+
+
 class TestFlowchartGeneratorSaveTxt:
     """Tests for FlowchartGenerator.save_txt method."""
 
@@ -410,6 +570,18 @@ class TestFlowchartGeneratorSavePng:
                 if os.path.exists(fn):
                     os.remove(fn)
 
+    def test_save_png_compress_level(self, generator, branching_input):
+        """Test that compress_level trades file size for speed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast = os.path.join(tmpdir, "fast.png")
+            small = os.path.join(tmpdir, "small.png")
+            generator.save_png(branching_input, fast, compress_level=1)
+            generator.save_png(branching_input, small, compress_level=9)
+
+            with Image.open(fast) as fast_img, Image.open(small) as small_img:
+                assert fast_img.tobytes() == small_img.tobytes()
+            assert os.path.getsize(fast) > os.path.getsize(small)
+
     def test_save_png_with_invalid_font(self, generator, simple_input):
         """Test that invalid font name falls back gracefully."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -505,6 +677,69 @@ class TestFlowchartGeneratorSavePng:
             if os.path.exists(filename):
                 os.remove(filename)
 
+    def test_save_png_glyph_grid_matches_line_drawing(self, generator, cyclic_input):
+        """Test that stamping cached glyphs matches drawing each line."""
+        flowchart = generator.generate(cyclic_input)
+        exporter = generator.exporter
+        font = exporter._load_monospace_font(32)
+
+        bbox = font.getbbox("M")
+        line_height = int((bbox[3] - bbox[1]) * 1.2)
+        lines = flowchart.split("\n")
+        size = (int(font.getlength("M")) * 80, line_height * len(lines) + 80)
+
+        stamped = Image.new("RGB", size, "#FFFFFF")
+        exporter._draw_glyph_grid(
+            stamped, lines, font, "#000000", 40, int(font.getlength("M")), line_height
+        )
+
+        expected = Image.new("RGB", size, "#FFFFFF")
+        draw = ImageDraw.Draw(expected)
+        for i, line in enumerate(lines):
+            draw.text((40, 40 + i * line_height), line, font=font, fill="#000000")
+
+        assert stamped.tobytes() == expected.tobytes()
+
+    def test_save_png_reuses_glyph_masks(self, generator, simple_input):
+        """Test that glyph masks are rasterized once per font across exports."""
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            filename = f.name
+
+        try:
+            generator.save_png(simple_input, filename)
+            font = generator.exporter._load_monospace_font(32)
+            masks = dict(generator.exporter._glyph_cache[font])
+            assert masks
+
+            generator.save_png(simple_input, filename)
+            cached = generator.exporter._glyph_cache[font]
+            assert all(cached[char] is mask for char, mask in masks.items())
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_save_png_reuses_font_metrics(self, generator, simple_input):
+        """Test that reference cell metrics are measured once per font."""
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            filename = f.name
+
+        try:
+            generator.save_png(simple_input, filename)
+            font = generator.exporter._load_monospace_font(32)
+            metrics = generator.exporter._metrics_cache[font]
+            bbox = font.getbbox("M")
+            assert metrics == (
+                bbox[2] - bbox[0],
+                bbox[3] - bbox[1],
+                font.getlength("M"),
+            )
+
+            generator.save_png(simple_input, filename)
+            assert generator.exporter._metrics_cache[font] is metrics
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
 
 class TestFlowchartGeneratorLoadFont:
     """Tests for FlowchartGenerator._load_monospace_font method."""
@@ -539,6 +774,37 @@ class TestFlowchartGeneratorLoadFont:
         bbox = font.getbbox("M")
         assert bbox is not None
 
+    def test_load_font_is_cached(self, generator):
+        """Test that repeated loads reuse the same font object."""
+        font = generator.exporter._load_monospace_font(16)
+        assert generator.exporter._load_monospace_font(16) is font
+        assert generator.exporter._load_monospace_font(18) is not font
+
+    def test_fallback_font_is_remembered(self, monkeypatch):
+        """Test that the fallback font that loaded is tried first next time."""
+        attempts = []
+        loaded = object()
+
+        def fake_truetype(font, size):
+            attempts.append(font)
+            if font != "Menlo":
+                raise OSError(f"cannot open resource: {font}")
+            return loaded
+
+        monkeypatch.setattr(ImageFont, "truetype", fake_truetype)
+        exporter = FlowchartExporter()
+        font = exporter._load_monospace_font(16, "NonexistentFont12345")
+        assert font is loaded
+        assert attempts[0] == "NonexistentFont12345"
+        assert exporter._resolved_font == "Menlo"
+
+        attempts.clear()
+        assert exporter._load_monospace_font(18) is loaded
+        assert attempts == ["Menlo"]
+
+        # Other exporters search the candidates on their own
+        assert FlowchartExporter()._resolved_font is None
+
     def test_load_font_with_valid_name(self, generator):
         """Test loading font by name."""
         # Try a font that should exist on most systems
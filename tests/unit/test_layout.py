@@ -1,5 +1,7 @@
 """Unit tests for the layout module."""
 
+import networkx as nx
+
 from retroflow.layout import LayoutResult, NetworkXLayout, NodeLayout, SugiyamaLayout
 
 
@@ -42,6 +44,7 @@ class TestLayoutResult:
         assert result.edges == []
         assert result.back_edges == set()
         assert result.has_cycles is False
+        assert result.node_layers == {}
 
     def test_layout_result_with_values(self):
         """Test LayoutResult with custom values."""
@@ -79,6 +82,13 @@ class TestNetworkXLayout:
         assert result.has_cycles is False
         assert len(result.back_edges) == 0
 
+    def test_layout_node_layers_match_nodes(self, layout_engine):
+        """Test node_layers mirrors each node's layer assignment."""
+        result = layout_engine.layout([("A", "B"), ("B", "C"), ("A", "C"), ("C", "A")])
+        assert result.node_layers == {
+            name: node.layer for name, node in result.nodes.items()
+        }
+
     def test_layout_layer_assignment(self, layout_engine, simple_connections):
         """Test that nodes are assigned to correct layers."""
         result = layout_engine.layout(simple_connections)
@@ -89,6 +99,12 @@ class TestNetworkXLayout:
         assert result.nodes["C"].layer == 2
         assert result.nodes["D"].layer == 3
 
+    def test_layout_skip_edge_uses_longest_path(self, layout_engine):
+        """Test a node sits below its deepest predecessor, not its shallowest."""
+        result = layout_engine.layout([("A", "B"), ("B", "C"), ("A", "C")])
+
+        assert result.nodes["C"].layer == 2
+
     def test_layout_branching(self, layout_engine, branching_connections):
         """Test layout of branching graph."""
         result = layout_engine.layout(branching_connections)
@@ -204,6 +220,52 @@ class TestNetworkXLayout:
         assert "C" in result.nodes
 
 
+class TestBreakCycles:
+    """Tests for back edge detection."""
+
+    def test_dense_cyclic_graph(self, layout_engine):
+        """Test a graph with a huge number of simple cycles is broken quickly."""
+        nodes = [f"N{i}" for i in range(12)]
+        connections = [(a, b) for a in nodes for b in nodes if a != b]
+
+        result = layout_engine.layout(connections)
+
+        dag = nx.DiGraph(connections)
+        dag.remove_edges_from(result.back_edges)
+        assert nx.is_directed_acyclic_graph(dag)
+        assert result.has_cycles is True
+
+    def test_long_cycle_does_not_recurse(self, layout_engine):
+        """Test a cycle longer than the recursion limit is broken."""
+        nodes = [f"N{i}" for i in range(3000)]
+        connections = list(zip(nodes, nodes[1:] + nodes[:1]))
+
+        result = layout_engine.layout(connections)
+
+        assert result.back_edges == {("N2999", "N0")}
+
+
+class TestRepeatedLayout:
+    """Tests for laying out the same connections more than once."""
+
+    def test_mutating_result_does_not_affect_next_layout(self, layout_engine):
+        """Test that each call returns a fresh result and graph."""
+        connections = [("A", "B"), ("B", "A")]
+        first = layout_engine.layout(connections)
+        first.node_layers["A"] = 99
+        first.nodes["B"].position = 7
+        first.back_edges.clear()
+        layout_engine.graph.add_edge("B", "Z")
+
+        second = layout_engine.layout(connections)
+
+        assert second is not first
+        assert second.node_layers["A"] == 0
+        assert second.nodes["B"].position == 0
+        assert second.back_edges == {("B", "A")}
+        assert set(layout_engine.graph.nodes()) == {"A", "B"}
+
+
 class TestSugiyamaLayoutAlias:
     """Tests for SugiyamaLayout alias."""
 
@@ -257,3 +319,13 @@ class TestBarycenterOrdering:
         assert len(result.nodes) == 5
         middle_layer = result.layers[1]
         assert set(middle_layer) == {"X", "Y", "Z"}
+
+    def test_unconnected_nodes_keep_their_order(self, layout_engine):
+        """Test nodes with no neighbors in the reference layer stay in place."""
+        graph = nx.DiGraph([("A", "B")])
+        graph.add_nodes_from(["Q", "P", "R"])
+        ordered = layout_engine._order_layer_by_barycenter(
+            ["Q", "P", "B", "R"], ["A"], graph, use_predecessors=True
+        )
+
+        assert ordered == ["Q", "B", "P", "R"]
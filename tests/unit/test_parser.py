@@ -169,6 +169,36 @@ class TestParseResult:
         assert result.groups == groups
 
 
+class TestParseCache:
+    """Tests for the per-parser parse cache."""
+
+    def test_repeated_parse_uses_cache(self, parser):
+        """Test that parsing the same input twice stores one cache entry."""
+        first = parser.parse_with_groups("[G: A]\nA -> B")
+        second = parser.parse_with_groups("[G: A]\nA -> B")
+        assert second == first
+        assert len(parser._parse_cache) == 1
+
+    def test_cached_result_is_copied(self, parser):
+        """Test that modifying a result does not affect later calls."""
+        first = parser.parse_with_groups("[G: A]\nA -> B")
+        first.connections.append(("B", "C"))
+        first.groups[0].members.append("B")
+
+        second = parser.parse_with_groups("[G: A]\nA -> B")
+        assert second.connections == [("A", "B")]
+        assert second.groups[0].members == ["A"]
+
+    def test_cache_is_bounded(self, parser):
+        """Test that the cache evicts the least recently used entries."""
+        from retroflow.parser import PARSE_CACHE_SIZE
+
+        for i in range(PARSE_CACHE_SIZE + 5):
+            parser.parse(f"A{i} -> B{i}")
+        assert len(parser._parse_cache) == PARSE_CACHE_SIZE
+        assert "A0 -> B0" not in parser._parse_cache
+
+
 class TestGroupParsing:
     """Tests for group definition parsing."""
 
@@ -339,6 +369,27 @@ class TestGroupParsing:
         assert len(result.groups) == 1
         assert result.groups[0].name == "My Group"
 
+    def test_split_group_line_matches_pattern(self, parser):
+        """Test the string-based split agrees with the GROUP_PATTERN spec."""
+        lines = [
+            "[G: A B]",
+            "[G:A]",
+            "[G:  ]",
+            "[G::]",
+            "[G: A] B]",
+            "[G]: A]",
+            "[G:]",
+            "[: A]",
+            "[]",
+            "[G A]",
+            "G: A",
+            "A -> B",
+        ]
+        for line in lines:
+            match = parser.GROUP_PATTERN.match(line)
+            expected = (match.group(1), match.group(2)) if match else None
+            assert parser._split_group_line(line) == expected
+
 
 class TestMatchNodeNames:
     """Tests for the _match_node_names helper method."""
@@ -412,3 +463,10 @@ class TestMatchNodeNames:
         known_nodes = {"A", "B"}
         result = parser._match_node_names("     ", known_nodes)
         assert result == []
+
+    def test_match_falls_back_to_shorter_name(self, parser):
+        """Test a longer name that only partly matches leaves the shorter match."""
+        known_nodes = {"A", "A Bx", "B"}
+        trie = parser._build_node_trie(known_nodes)
+        result = parser._match_node_names("A B", known_nodes, trie)
+        assert result == ["A", "B"]
@@ -65,6 +65,28 @@ class TestGroupConstants:
         assert GROUP_EDGE_MARGIN <= 10
 
 
+class TestBoxDimensionCache:
+    """Tests for caching of box dimensions per node label."""
+
+    def test_repeat_calculation_reuses_dimensions(
+        self, position_calculator, simple_layout
+    ):
+        """Test that a second calculation returns the cached dimensions."""
+        first = position_calculator.calculate_all_box_dimensions(simple_layout)
+        second = position_calculator.calculate_all_box_dimensions(simple_layout)
+        assert first == second
+        assert all(second[name] is first[name] for name in first)
+
+    def test_cache_cleared_when_settings_change(
+        self, position_calculator, simple_layout
+    ):
+        """Test that changing min_box_width recomputes dimensions."""
+        position_calculator.calculate_all_box_dimensions(simple_layout)
+        position_calculator.min_box_width = 20
+        dims = position_calculator.calculate_all_box_dimensions(simple_layout)
+        assert all(d.width == 20 for d in dims.values())
+
+
 class TestCalculateGroupBoundaries:
     """Tests for calculate_group_boundaries method."""
 
@@ -139,6 +161,42 @@ class TestCalculateGroupBoundaries:
         boundaries = position_calculator.calculate_group_boundaries([], {}, {})
         assert boundaries == []
 
+    def test_offset_matches_recalculation(self, position_calculator):
+        """Test translating boundaries matches recalculating moved boxes."""
+        groups = [GroupDefinition(name="A much longer title", members=["A", "B"])]
+        box_positions = {"A": (10, 10), "B": (30, 18)}
+        box_dimensions = {
+            "A": BoxDimensions(width=15, height=5, text_lines=["A"]),
+            "B": BoxDimensions(width=9, height=3, text_lines=["B"]),
+        }
+        boundaries = position_calculator.calculate_group_boundaries(
+            groups, box_positions, box_dimensions
+        )
+        moved = {name: (x + 4, y + 3) for name, (x, y) in box_positions.items()}
+
+        assert position_calculator.offset_group_boundaries(
+            boundaries, 4, 3
+        ) == position_calculator.calculate_group_boundaries(
+            groups, moved, box_dimensions
+        )
+
+
+class TestCalculateCanvasSize:
+    """Tests for calculate_canvas_size method."""
+
+    def test_group_boxes_extend_canvas(self, position_calculator):
+        """Test that group boxes beyond the nodes widen the canvas."""
+        box_positions = {"A": (10, 10)}
+        box_dimensions = {"A": BoxDimensions(width=15, height=5, text_lines=["A"])}
+        group = GroupBoundary(name="G", members=["A"], x=5, y=5, width=40, height=30)
+
+        assert position_calculator.calculate_canvas_size(
+            box_dimensions, box_positions
+        ) == (27, 17)
+        assert position_calculator.calculate_canvas_size(
+            box_dimensions, box_positions, [group]
+        ) == (47, 37)
+
 
 class TestResolveGroupOverlaps:
     """Tests for resolve_group_overlaps method."""
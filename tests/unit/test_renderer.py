@@ -1,5 +1,7 @@
 """Unit tests for the renderer module."""
 
+import pytest
+
 from retroflow.renderer import (
     ARROW_CHARS,
     BOX_CHARS,
@@ -86,6 +88,63 @@ class TestCanvas:
         assert canvas.get(10, 5) == "T"
         assert canvas.get(13, 5) == "t"
 
+    def test_canvas_draw_text_clips_to_bounds(self):
+        """Test text running off either edge keeps only the visible part."""
+        c = Canvas(5, 2)
+        c.draw_text(-2, 0, "abcd")
+        c.draw_text(3, 1, "wxyz")
+        c.draw_text(0, 4, "hidden")
+        assert c.render() == "cd\n   wx"
+
+    def test_canvas_hline_fills_span(self, canvas):
+        """Test hline fills the half-open span with a character."""
+        canvas.hline(2, 6, 3, "-")
+        assert [canvas.get(x, 3) for x in range(1, 7)] == [" ", "-", "-", "-", "-", " "]
+
+    def test_canvas_hline_clips_to_bounds(self):
+        """Test hline ignores cells outside the canvas."""
+        c = Canvas(5, 2)
+        c.hline(-3, 10, 0, "-")
+        c.hline(0, 5, 7, "X")
+        assert c.render() == "-----"
+
+    def test_canvas_get_hspan(self, canvas):
+        """Test get_hspan returns the characters of a row span."""
+        canvas.draw_text(3, 2, "abc")
+        assert canvas.get_hspan(2, 6, 2) == [" ", "a", "b", "c"]
+        assert canvas.get_hspan(0, 5, -1) == []
+
+    def test_canvas_vline_fills_span(self, canvas):
+        """Test vline fills the half-open column span with a character."""
+        canvas.vline(4, 1, 4, "|")
+        assert canvas.get_vspan(4, 0, 5) == [" ", "|", "|", "|", " "]
+
+    def test_canvas_vline_clips_to_bounds(self):
+        """Test vline ignores cells outside the canvas."""
+        c = Canvas(3, 3)
+        c.vline(1, -2, 10, "|")
+        c.vline(5, 0, 3, "X")
+        assert c.render() == " |\n |\n |"
+        assert c.get_vspan(-1, 0, 3) == []
+
+    def test_canvas_merge_lines(self, canvas):
+        """Test merge_hline/merge_vline only replace mapped characters."""
+        canvas.set(3, 2, "|")
+        canvas.set(5, 2, "#")
+        canvas.merge_hline(2, 6, 2, {" ": "-", "|": "+"})
+        assert canvas.get_hspan(1, 7, 2) == [" ", "-", "+", "-", "#", " "]
+
+        canvas.merge_vline(3, 1, 4, {" ": "|", "-": "+"})
+        assert canvas.get_vspan(3, 0, 5) == [" ", "|", "+", "|", " "]
+
+    def test_canvas_merge_cell(self, canvas):
+        """Test merge_cell replaces a single mapped character."""
+        canvas.set(2, 2, "|")
+        canvas.merge_cell(2, 2, {"|": "+", " ": "-"})
+        canvas.merge_cell(4, 2, {"|": "+"})
+        canvas.merge_cell(-1, 2, {" ": "-"})
+        assert canvas.get_hspan(1, 6, 2) == [" ", "+", " ", " ", " "]
+
     def test_canvas_render_simple(self):
         """Test rendering canvas to string."""
         c = Canvas(5, 3)
@@ -112,6 +171,42 @@ class TestCanvas:
         result = c.render()
         assert not result.endswith("\n\n")
 
+    def test_canvas_grid_reads_and_writes_cells(self):
+        """Test grid[y][x] still reads and writes canvas cells."""
+        c = Canvas(4, 3)
+        c.set(1, 2, "X")
+        assert len(c.grid) == 3
+        assert c.grid[2][1] == "X"
+        assert c.grid[2] == [" ", "X", " ", " "]
+
+        c.grid[0][3] = "Y"
+        assert c.get(3, 0) == "Y"
+        assert c.grid[0][-1] == "Y"
+
+    def test_canvas_grid_rows_are_reused(self):
+        """Test grid returns the same row views on every access."""
+        c = Canvas(4, 3)
+        assert c.grid is c.grid
+        assert c.grid[1] is c.grid[1]
+
+    def test_canvas_grid_slice_assignment(self):
+        """Test slice assignment through grid rows writes canvas cells."""
+        c = Canvas(5, 2)
+        c.grid[1][1:4] = "abc"
+        c.grid[0][::2] = ["x", "y", "z"]
+        assert c.render() == "x y z\n abc"
+        assert c.grid[1][1:3] == ["a", "b"]
+
+        with pytest.raises(ValueError):
+            c.grid[0][0:2] = "abc"
+
+    def test_canvas_grid_assignment_replaces_cells(self):
+        """Test assigning grid rebuilds the canvas from rows."""
+        c = Canvas(1, 1)
+        c.grid = [["a", "b"], ["c", "d"]]
+        assert (c.width, c.height) == (2, 2)
+        assert c.render() == "ab\ncd"
+
 
 class TestBoxRenderer:
     """Tests for BoxRenderer class."""